@@ -11,8 +11,6 @@ import logging
 import sys
 from pathlib import Path
 
-from src.config import get_config
-
 
 def setup_logging(log_level: str) -> None:
     """Configure application logging."""
@@ -93,21 +91,33 @@ def cmd_query(args: argparse.Namespace) -> int:
 
 
 def cmd_ui(args: argparse.Namespace) -> int:
-    """Launch the Streamlit UI."""
-    import subprocess
+    """
+    Launch the Streamlit UI.
+    
+    Replaces the current process with Streamlit (no child interpreter is
+    forked), so this function only returns if the exec fails.
+    """
+    import os
     
     logger = logging.getLogger(__name__)
     logger.info("Launching Streamlit UI...")
     
     app_path = Path(__file__).parent / "src" / "app" / "main.py"
     
-    subprocess.run([
-        sys.executable, "-m", "streamlit", "run",
-        str(app_path),
-        "--server.headless", "true" if args.headless else "false",
-    ])
+    # Buffered output would be lost when the process image is replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
     
-    return 0
+    try:
+        os.execv(sys.executable, [
+            sys.executable, "-m", "streamlit", "run",
+            str(app_path),
+            "--server.headless", "true" if args.headless else "false",
+        ])
+    except OSError as e:
+        logger.error(f"Failed to launch Streamlit: {e}")
+    
+    return 1
 
 
 def main() -> int:
@@ -155,7 +165,9 @@ def main() -> int:
     
     args = parser.parse_args()
     
-    # Setup
+    # Setup (config is imported after parsing so --help stays fast)
+    from src.config import get_config
+    
     config = get_config()
     log_level = "DEBUG" if args.debug else config.log_level
     setup_logging(log_level)
@@ -47,6 +47,27 @@ CREATE INDEX risk_event_index IF NOT EXISTS
 FOR (r:RiskEvent) ON (r.type, r.severity);
 
 
+// =====================
+// FULL-TEXT INDEXES
+// =====================
+
+// Entity name lookup used by the hybrid retriever. Every node merged by the
+// ingestion pipeline carries the shared :Entity label next to its own type.
+CREATE FULLTEXT INDEX entity_name_idx IF NOT EXISTS
+FOR (n:Entity) ON EACH [n.name];
+
+
+// =====================
+// MIGRATION (one-off)
+// =====================
+
+// Graphs ingested before the shared :Entity label was introduced: label the
+// existing nodes, and drop an entity_name_idx created over the old label list
+// so it is recreated (above, or by the retriever) over :Entity only.
+// MATCH (n) WHERE n.name IS NOT NULL AND NOT n:Entity SET n:Entity;
+// DROP INDEX entity_name_idx IF EXISTS;
+
+
 // =====================
 // RELATIONSHIP EXAMPLES
 // =====================
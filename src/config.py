@@ -6,16 +6,12 @@ Centralizes all configuration settings with environment variable support.
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
 
 def _get_env(key: str, default: Optional[str] = None) -> str:
     """Get environment variable with optional default."""
@@ -27,15 +23,37 @@ def _get_env(key: str, default: Optional[str] = None) -> str:
 
 def _get_env_bool(key: str, default: bool = False) -> bool:
     """Get boolean environment variable."""
-    return os.getenv(key, str(default)).lower() in ("true", "1", "yes")
+    value = os.getenv(key)
+    if value is None:
+        return default
+    return value.lower() in ("true", "1", "yes")
 
 
 def _get_env_int(key: str, default: int) -> int:
     """Get integer environment variable."""
-    return int(os.getenv(key, str(default)))
+    value = os.getenv(key)
+    if value is None:
+        return default
+    return int(value)
+
+
+def _get_env_float(key: str, default: Optional[float]) -> Optional[float]:
+    """Get float environment variable (default if unset or empty)."""
+    value = os.getenv(key)
+    if not value:
+        return default
+    return float(value)
+
 
+def _get_env_path(key: str) -> Optional[Path]:
+    """Get optional path environment variable (None if unset or empty)."""
+    value = os.getenv(key)
+    if not value:
+        return None
+    return Path(value).expanduser()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Neo4jConfig:
     """Neo4j database configuration."""
     
@@ -45,7 +63,7 @@ class Neo4jConfig:
     database: str = field(default_factory=lambda: _get_env("NEO4J_DATABASE", "neo4j"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChromaConfig:
     """ChromaDB configuration."""
     
@@ -57,7 +75,7 @@ class ChromaConfig:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OllamaConfig:
     """Ollama LLM configuration."""
     
@@ -70,15 +88,29 @@ class OllamaConfig:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetrievalConfig:
     """Retrieval settings."""
     
     vector_top_k: int = field(default_factory=lambda: _get_env_int("VECTOR_TOP_K", 5))
     graph_max_hops: int = field(default_factory=lambda: _get_env_int("GRAPH_MAX_HOPS", 2))
+    # SQLite file the retrieval caches are saved to and restored from
+    # (disabled when unset)
+    cache_path: Optional[Path] = field(
+        default_factory=lambda: _get_env_path("RETRIEVAL_CACHE_PATH")
+    )
+    # Cosine similarity at which a paraphrased query reuses a cached result
+    # (semantic caching is disabled when unset)
+    semantic_cache_threshold: Optional[float] = field(
+        default_factory=lambda: _get_env_float("RETRIEVAL_SEMANTIC_CACHE_THRESHOLD", None)
+    )
+    # Load the Ollama models in the background when a retriever is created
+    preload_models: bool = field(
+        default_factory=lambda: _get_env_bool("RETRIEVAL_PRELOAD_MODELS", False)
+    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application-level configuration."""
     
@@ -93,6 +125,17 @@ class AppConfig:
 
 
 # Global configuration instance
+@functools.lru_cache(maxsize=1)
 def get_config() -> AppConfig:
-    """Get the application configuration."""
+    """
+    Get the application configuration.
+    
+    The configuration is immutable, so it is built once and shared.
+    Call ``get_config.cache_clear()`` to re-read the environment.
+    """
+    from dotenv import load_dotenv
+    
+    # Load environment variables from .env file on first use rather than
+    # at import time, so that e.g. ``--help`` never touches the filesystem.
+    load_dotenv()
     return AppConfig()
@@ -3,12 +3,19 @@ Database module for Atlas-GRAG.
 Manages connections to Neo4j and ChromaDB.
 """
 
-from src.database.graph_db import GraphDatabaseError, GraphDatabaseManager
+from src.database.graph_db import (
+    ENTITY_NAME_INDEX,
+    GraphDatabaseError,
+    GraphDatabaseManager,
+)
+from src.database.invalidation import InvalidationNotifier
 from src.database.vector_db import OllamaEmbeddings, VectorDatabaseManager
 
 __all__ = [
     "GraphDatabaseManager",
     "GraphDatabaseError",
+    "ENTITY_NAME_INDEX",
     "VectorDatabaseManager",
     "OllamaEmbeddings",
+    "InvalidationNotifier",
 ]
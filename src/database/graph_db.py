@@ -13,6 +13,18 @@ from neo4j import GraphDatabase
 from neo4j.exceptions import ServiceUnavailable
 
 from src.config import get_config
+from src.database.invalidation import InvalidationNotifier
+
+
+# Full-text index over entity names, used for fast entity lookups at query time
+ENTITY_NAME_INDEX = "entity_name_idx"
+
+# Secondary label added to every merged node, whatever its extracted type;
+# the entity name index covers only this label (see schema/constraints.cypher)
+ENTITY_LABEL = "Entity"
+
+# How long ensure_fulltext_index() waits for a new index to come online
+FULLTEXT_INDEX_TIMEOUT_SECONDS = 300
 
 
 class GraphDatabaseError(Exception):
@@ -20,12 +32,14 @@ class GraphDatabaseError(Exception):
     pass
 
 
-class GraphDatabaseManager:
+class GraphDatabaseManager(InvalidationNotifier):
     """
     Manager for Neo4j graph database operations.
     
     Provides connection management, query execution, and idempotent
-    MERGE operations for the supply chain knowledge graph.
+    MERGE operations for the supply chain knowledge graph. Listeners
+    registered with add_invalidation_listener() are notified after every
+    MERGE.
     
     Usage:
         with GraphDatabaseManager() as manager:
@@ -48,6 +62,8 @@ class GraphDatabaseManager:
             password: Neo4j password (defaults to config)
             database: Neo4j database name (defaults to config)
         """
+        super().__init__()
+        
         config = get_config().neo4j
         
         self._uri = uri or config.uri
@@ -114,6 +130,31 @@ class GraphDatabaseManager:
             result = session.run(query, parameters)
             return result.data()
     
+    def ensure_fulltext_index(self) -> None:
+        """
+        Create the entity name full-text index if it does not exist.
+        
+        The index lets entity lookups use Lucene instead of scanning every
+        node's name. Creation is idempotent but asynchronous, so this waits
+        until the index is online; a newly created index that is still
+        populating would otherwise return no matches.
+        
+        Raises:
+            Exception: If the index cannot be created or does not come online
+                within FULLTEXT_INDEX_TIMEOUT_SECONDS
+        """
+        query = (
+            f"CREATE FULLTEXT INDEX {ENTITY_NAME_INDEX} IF NOT EXISTS "
+            f"FOR (n:{ENTITY_LABEL}) ON EACH [n.name]"
+        )
+        
+        with self._driver.session(database=self._database) as session:
+            session.run(query).consume()
+            session.run(
+                "CALL db.awaitIndex($index, $timeout)",
+                {"index": ENTITY_NAME_INDEX, "timeout": FULLTEXT_INDEX_TIMEOUT_SECONDS},
+            ).consume()
+    
     def merge_node(
         self,
         label: str,
@@ -124,6 +165,9 @@ class GraphDatabaseManager:
         """
         Merge a node using MERGE for idempotency.
         
+        The node also gets the shared ENTITY_LABEL, so the entity name index
+        covers it whatever its own label.
+        
         Args:
             label: Node label (e.g., 'Company', 'Product')
             properties: Properties to match on
@@ -149,11 +193,14 @@ class GraphDatabaseManager:
             query += f" ON MATCH SET {match_string}"
             params.update({f"match_{k}": v for k, v in on_match.items()})
         
-        query += " RETURN n"
+        query += f" SET n:{ENTITY_LABEL} RETURN n"
         
         with self._driver.session(database=self._database) as session:
             result = session.run(query, params)
-            return result.single()
+            node = result.single()
+        
+        self._notify_invalidation()
+        return node
     
     def merge_relationship(
         self,
@@ -167,6 +214,8 @@ class GraphDatabaseManager:
         """
         Merge a relationship between two nodes using MERGE for idempotency.
         
+        Both nodes also get the shared ENTITY_LABEL (see merge_node()).
+        
         Args:
             from_label: Source node label
             from_props: Source node matching properties
@@ -183,6 +232,7 @@ class GraphDatabaseManager:
         MERGE (a:{from_label} {{{from_prop_string}}})
         MERGE (b:{to_label} {{{to_prop_string}}})
         MERGE (a)-[r:{rel_type}]->(b)
+        SET a:{ENTITY_LABEL}, b:{ENTITY_LABEL}
         """
         
         params: Dict[str, Any] = {}
@@ -198,6 +248,8 @@ class GraphDatabaseManager:
         
         with self._driver.session(database=self._database) as session:
             session.run(query, params)
+        
+        self._notify_invalidation()
     
     def find_neighbors(
         self,
@@ -0,0 +1,91 @@
+"""
+Change Notification for Atlas-GRAG Stores.
+
+Lets caches built on top of the graph and vector stores (such as the
+hybrid retriever's) be flushed automatically when data is written.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from typing import Callable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+InvalidationListener = Callable[[], None]
+
+
+class InvalidationNotifier:
+    """
+    Mixin for stores that notify listeners after their data changes.
+    
+    Bound methods are held through weak references, so registering e.g.
+    ``retriever.invalidate`` does not keep the retriever alive; plain
+    functions are held strongly.
+    
+    Usage:
+        manager.add_invalidation_listener(retriever.invalidate)
+        manager.merge_node(...)  # retriever.invalidate() is called
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the listener registry."""
+        self._invalidation_listeners: List[Union[weakref.WeakMethod, InvalidationListener]] = []
+        self._invalidation_lock = threading.Lock()
+    
+    def add_invalidation_listener(self, listener: InvalidationListener) -> None:
+        """
+        Register a callable to run after data is modified.
+        
+        Entries of collected listeners are pruned first, so a long-lived
+        store does not accumulate them between writes.
+        
+        Args:
+            listener: Callable taking no arguments
+        """
+        ref = weakref.WeakMethod(listener) if hasattr(listener, "__self__") else listener
+        with self._invalidation_lock:
+            self._invalidation_listeners = [
+                entry for entry in self._invalidation_listeners
+                if self._resolve(entry) is not None
+            ]
+            self._invalidation_listeners.append(ref)
+    
+    def remove_invalidation_listener(self, listener: InvalidationListener) -> None:
+        """
+        Unregister a previously added listener (no-op if not registered).
+        
+        Args:
+            listener: Callable passed to add_invalidation_listener()
+        """
+        with self._invalidation_lock:
+            self._invalidation_listeners = [
+                ref for ref in self._invalidation_listeners
+                if self._resolve(ref) not in (None, listener)
+            ]
+    
+    @staticmethod
+    def _resolve(
+        ref: Union[weakref.WeakMethod, InvalidationListener]
+    ) -> Optional[InvalidationListener]:
+        """Get the listener behind a registry entry (None if collected)."""
+        return ref() if isinstance(ref, weakref.WeakMethod) else ref
+    
+    def _notify_invalidation(self) -> None:
+        """Call every live listener, dropping those that were collected."""
+        with self._invalidation_lock:
+            listeners = [self._resolve(ref) for ref in self._invalidation_listeners]
+            self._invalidation_listeners = [
+                ref for ref, listener in zip(self._invalidation_listeners, listeners, strict=True)
+                if listener is not None
+            ]
+        
+        for listener in listeners:
+            if listener is None:
+                continue
+            try:
+                listener()
+            except Exception as e:
+                logger.warning(f"Invalidation listener failed: {e}")
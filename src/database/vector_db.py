@@ -7,6 +7,7 @@ using Ollama embeddings for local-first operation.
 
 from __future__ import annotations
 
+import itertools
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -15,6 +16,7 @@ import chromadb
 from chromadb.config import Settings
 
 from src.config import get_config
+from src.database.invalidation import InvalidationNotifier
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,27 @@ class OllamaEmbeddings:
                 raise ImportError("ollama package is required for embeddings")
         return self._client
     
+    def embed_text(self, text: str) -> List[float]:
+        """
+        Generate the embedding for a single text.
+        
+        Unlike calling the instance, errors are raised rather than replaced
+        by a zero vector, so callers can tell a real embedding from a failure.
+        (Not named ``embed_query``, which Chroma calls with ``input=``.)
+        
+        Args:
+            text: String to embed
+            
+        Returns:
+            Embedding vector
+        """
+        response = self.client.embeddings(
+            model=self.model,
+            prompt=text
+        )
+        embedding: List[float] = response["embedding"]
+        return embedding
+    
     def __call__(self, input: List[str]) -> List[List[float]]:
         """
         Generate embeddings for input texts.
@@ -66,11 +89,7 @@ class OllamaEmbeddings:
         embeddings = []
         for text in input:
             try:
-                response = self.client.embeddings(
-                    model=self.model,
-                    prompt=text
-                )
-                embeddings.append(response["embedding"])
+                embeddings.append(self.embed_text(text))
             except Exception as e:
                 logger.error(f"Error generating embedding: {e}")
                 # Return zero vector as fallback
@@ -78,12 +97,14 @@ class OllamaEmbeddings:
         return embeddings
 
 
-class VectorDatabaseManager:
+class VectorDatabaseManager(InvalidationNotifier):
     """
     Manager for ChromaDB vector database operations.
     
     Provides document storage, embedding generation via Ollama,
-    and semantic similarity search.
+    and semantic similarity search. Listeners registered with
+    add_invalidation_listener() are notified after documents are added
+    or a collection is deleted.
     
     Usage:
         manager = VectorDatabaseManager()
@@ -109,6 +130,8 @@ class VectorDatabaseManager:
             embedding_model: Ollama model for embeddings
             ollama_base_url: Ollama server URL
         """
+        super().__init__()
+        
         config = get_config()
         
         self._persist_dir = persist_directory or config.chroma.persist_directory
@@ -133,6 +156,11 @@ class VectorDatabaseManager:
         # Cache for collections
         self._collections: Dict[str, Any] = {}
     
+    @property
+    def embedding_model(self) -> str:
+        """Ollama model used to embed documents and queries."""
+        return self._embedding_model
+    
     def is_healthy(self) -> bool:
         """
         Check if the database is healthy.
@@ -186,13 +214,31 @@ class VectorDatabaseManager:
             ids=ids,
             metadatas=metadatas
         )
+        
+        self._notify_invalidation()
+    
+    def embed(self, text: str) -> List[float]:
+        """
+        Generate the embedding for a query text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector
+            
+        Raises:
+            Exception: If the embedding model is unavailable
+        """
+        return self._embedding_fn.embed_text(text)
     
     def query_similar(
         self,
         collection_name: str,
         query_text: str,
         n_results: int = 5,
-        where: Optional[Dict[str, Any]] = None
+        where: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         Query for similar documents.
@@ -202,31 +248,79 @@ class VectorDatabaseManager:
             query_text: Query string
             n_results: Number of results to return
             where: Optional metadata filter
+            query_embedding: Precomputed embedding of query_text (skips
+                embedding the query again)
             
         Returns:
             List of similar documents with metadata and distances
         """
-        collection = self.get_collection(collection_name)
-        
-        results = collection.query(
+        return self.query_similar_batch(
+            collection_name=collection_name,
             query_texts=[query_text],
             n_results=n_results,
-            where=where
-        )
+            where=where,
+            query_embeddings=[query_embedding] if query_embedding is not None else None
+        )[0]
+    
+    def query_similar_batch(
+        self,
+        collection_name: str,
+        query_texts: List[str],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        query_embeddings: Optional[List[List[float]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Query for similar documents for several queries in one call.
         
-        # Transform results into list of dicts
-        documents = []
-        if results["ids"] and results["ids"][0]:
-            for i, doc_id in enumerate(results["ids"][0]):
-                doc = {
-                    "id": doc_id,
-                    "document": results["documents"][0][i] if results["documents"] else None,
-                    "distance": results["distances"][0][i] if results["distances"] else None,
-                    "metadata": results["metadatas"][0][i] if results["metadatas"] else None
-                }
-                documents.append(doc)
+        Args:
+            collection_name: Collection to search
+            query_texts: Query strings
+            n_results: Number of results to return per query
+            where: Optional metadata filter
+            query_embeddings: Precomputed embeddings of query_texts, in the
+                same order (skips embedding the queries again)
+            
+        Returns:
+            One list of similar documents per query, in input order
+        """
+        collection = self.get_collection(collection_name)
+        
+        if query_embeddings is not None:
+            results = collection.query(
+                query_embeddings=query_embeddings,
+                n_results=n_results,
+                where=where
+            )
+        else:
+            results = collection.query(
+                query_texts=query_texts,
+                n_results=n_results,
+                where=where
+            )
+        
+        # Transform results into one list of dicts per query. Chroma returns
+        # each field as a column (already ordered by distance), so rows are
+        # assembled by zipping the columns; absent fields become None.
+        ids = results["ids"] or []
         
-        return documents
+        batches: List[List[Dict[str, Any]]] = []
+        for q in range(len(query_texts)):
+            if q >= len(ids) or not ids[q]:
+                batches.append([])
+                continue
+            
+            row_ids = ids[q]
+            columns = [
+                results[name][q] if results[name] else itertools.repeat(None, len(row_ids))
+                for name in ("documents", "distances", "metadatas")
+            ]
+            batches.append([
+                {"id": doc_id, "document": document, "distance": distance, "metadata": metadata}
+                for doc_id, document, distance, metadata in zip(row_ids, *columns, strict=True)
+            ])
+        
+        return batches
     
     def delete_collection(self, name: str) -> None:
         """
@@ -238,6 +332,8 @@ class VectorDatabaseManager:
         self._client.delete_collection(name)
         if name in self._collections:
             del self._collections[name]
+        
+        self._notify_invalidation()
     
     def get_document_count(self, collection_name: str) -> int:
         """
@@ -3,10 +3,14 @@ Retriever module for Atlas-GRAG.
 Implements hybrid search combining vector and graph retrieval.
 """
 
-from src.retriever.hybrid import GraphPath, HybridRetriever, RetrievalResult
+from src.retriever.cache import QueryCache, SemanticIndex
+from src.retriever.hybrid import GraphEdge, GraphPath, HybridRetriever, RetrievalResult
 
 __all__ = [
     "HybridRetriever",
     "RetrievalResult",
     "GraphPath",
+    "GraphEdge",
+    "QueryCache",
+    "SemanticIndex",
 ]
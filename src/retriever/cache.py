@@ -0,0 +1,339 @@
+"""
+Query Cache for Atlas-GRAG.
+
+Thread-safe LRU cache with optional time-to-live, used by the hybrid
+retriever to memoize entity extraction and full retrieval results so that
+repeated questions skip the LLM, vector and graph round-trips. Caches can
+be saved to and restored from a SQLite file to start new processes warm,
+and SemanticIndex maps paraphrased queries onto cached ones.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Hashable, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCache:
+    """
+    Bounded LRU cache with per-entry expiry.
+    
+    Entries are evicted least-recently-used first once ``max_size`` is
+    reached, and treated as missing once older than ``ttl`` seconds.
+    
+    Example:
+        cache = QueryCache(max_size=100, ttl=60)
+        key = QueryCache.make_key("Singapore strike impact?")
+        if (result := cache.get(key)) is None:
+            result = compute(...)
+            cache.put(key, result)
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries kept
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(text: str) -> str:
+        """
+        Build a cache key from query text.
+        
+        The text is normalized (stripped, lower-cased) and hashed so keys
+        have a fixed size regardless of query length.
+        
+        Args:
+            text: Query text
+        
+        Returns:
+            SHA-256 hex digest of the normalized text
+        """
+        return hashlib.sha256(text.strip().lower().encode("utf-8")).hexdigest()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else float("inf")
+        
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        """Number of entries currently stored (including expired ones)."""
+        return len(self._entries)
+    
+    def save(self, path: Union[str, Path], name: str = "default") -> int:
+        """
+        Write the unexpired entries to a SQLite file.
+        
+        Several caches can share one file under different names; saving
+        replaces any entries previously stored under the same name. Keys
+        and values are pickled, so only load files this process wrote.
+        
+        Args:
+            path: Database file (created along with its directory if missing)
+            name: Name the entries are stored under
+        
+        Returns:
+            Number of entries written
+        """
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Expiry is stored as wall-clock time, since monotonic clocks are
+        # not comparable across processes
+        now_monotonic, now_wall = time.monotonic(), time.time()
+        with self._lock:
+            rows = [
+                (
+                    name,
+                    pickle.dumps(key),
+                    pickle.dumps(value),
+                    None if expires_at == float("inf") else expires_at - now_monotonic + now_wall,
+                    position,
+                )
+                for position, (key, (expires_at, value)) in enumerate(self._entries.items())
+                if expires_at >= now_monotonic
+            ]
+        
+        with closing(sqlite3.connect(path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS query_cache ("
+                "name TEXT, key BLOB, value BLOB, expires_at REAL, position INTEGER, "
+                "PRIMARY KEY (name, key))"
+            )
+            conn.execute("DELETE FROM query_cache WHERE name = ?", (name,))
+            conn.executemany("INSERT INTO query_cache VALUES (?, ?, ?, ?, ?)", rows)
+        
+        return len(rows)
+    
+    def load(self, path: Union[str, Path], name: str = "default") -> int:
+        """
+        Restore entries saved with save().
+        
+        Expired entries are skipped and, if more were saved than fit, only
+        the most recently used ones are kept. A missing or unreadable file
+        leaves the cache unchanged. Values are unpickled, so only load files
+        that nobody else can write.
+        
+        Args:
+            path: Database file
+            name: Name the entries were stored under
+        
+        Returns:
+            Number of entries restored
+        """
+        path = Path(path).expanduser()
+        if not path.exists():
+            return 0
+        
+        try:
+            with closing(sqlite3.connect(path)) as conn:
+                rows = conn.execute(
+                    "SELECT key, value, expires_at FROM query_cache "
+                    "WHERE name = ? ORDER BY position DESC LIMIT ?",
+                    (name, self._max_size),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load cache from {path}: {e}")
+            return 0
+        
+        now_monotonic, now_wall = time.monotonic(), time.time()
+        restored = 0
+        with self._lock:
+            # Rows are most recent first; insert oldest first to keep LRU order
+            for key, value, expires_at in reversed(rows):
+                if expires_at is not None and expires_at < now_wall:
+                    continue
+                try:
+                    key, value = pickle.loads(key), pickle.loads(value)
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable cache entry: {e}")
+                    continue
+                
+                self._entries[key] = (
+                    float("inf") if expires_at is None else expires_at - now_wall + now_monotonic,
+                    value,
+                )
+                self._entries.move_to_end(key)
+                restored += 1
+            
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        
+        return restored
+
+
+class SemanticIndex:
+    """
+    Nearest-neighbor index over the embeddings of cached queries.
+    
+    Used in front of an exact-match QueryCache: on a miss, the query
+    embedding is compared with those of recently cached queries, and the
+    key of the most similar one is returned if its cosine similarity
+    reaches ``threshold``. Embeddings live in a fixed-size ring buffer, so
+    the oldest are overwritten once ``max_size`` is reached; keys whose
+    cache entry has since been evicted simply miss in the cache.
+    
+    Example:
+        index = SemanticIndex(threshold=0.95)
+        index.add(key, embedding)
+        similar_key = index.lookup(other_embedding)
+    """
+    
+    def __init__(self, threshold: float, max_size: int = 1024) -> None:
+        """
+        Initialize the index.
+        
+        Args:
+            threshold: Minimum cosine similarity for a match (0 to 1)
+            max_size: Maximum number of embeddings kept
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        
+        # NumPy is only needed once semantic caching is enabled
+        import numpy as np
+        
+        self._np = np
+        self._threshold = threshold
+        self._max_size = max_size
+        self._vectors: Optional[np.ndarray] = None
+        self._keys: List[Optional[Hashable]] = [None] * max_size
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+    
+    def _normalize(self, embedding: Sequence[float]) -> Optional[np.ndarray]:
+        """Return the embedding as a unit float32 vector, or None if it has no direction."""
+        vector = self._np.asarray(embedding, dtype=self._np.float32)
+        norm = float(self._np.linalg.norm(vector))
+        if vector.ndim != 1 or not norm or not self._np.isfinite(norm):
+            return None
+        return vector / norm
+    
+    def add(self, key: Hashable, embedding: Sequence[float]) -> None:
+        """
+        Index the embedding of a cached query.
+        
+        Args:
+            key: Cache key the query is stored under
+            embedding: Query embedding
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+                # First insert, or the embedding model changed
+                self._vectors = self._np.zeros((self._max_size, vector.shape[0]), self._np.float32)
+                self._keys = [None] * self._max_size
+                self._next = self._count = 0
+            
+            self._vectors[self._next] = vector
+            self._keys[self._next] = key
+            self._next = (self._next + 1) % self._max_size
+            self._count = min(self._count + 1, self._max_size)
+    
+    def lookup(self, embedding: Sequence[float]) -> Optional[Hashable]:
+        """
+        Find the key of the most similar indexed query.
+        
+        Args:
+            embedding: Query embedding
+        
+        Returns:
+            Key of the best match at or above the threshold, or None
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+        
+        with self._lock:
+            vectors = self._vectors
+            if vectors is None or not self._count or vectors.shape[1] != vector.shape[0]:
+                return None
+            
+            similarities = vectors[:self._count] @ vector
+            best = int(similarities.argmax())
+            if similarities[best] < self._threshold:
+                return None
+            return self._keys[best]
+    
+    def clear(self) -> None:
+        """Remove all embeddings."""
+        with self._lock:
+            self._vectors = None
+            self._keys = [None] * self._max_size
+            self._next = self._count = 0
+    
+    def __len__(self) -> int:
+        """Number of embeddings currently indexed."""
+        return self._count
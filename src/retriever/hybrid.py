@@ -10,36 +10,436 @@ require connecting multiple pieces of information through graph traversal.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import functools
+import itertools
 import logging
 import re
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
-
-from langchain_ollama import OllamaLLM
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from src.config import get_config
-from src.database.graph_db import GraphDatabaseManager
-from src.database.vector_db import VectorDatabaseManager
+from src.retriever.cache import QueryCache, SemanticIndex
+
+if TYPE_CHECKING:
+    from langchain_core.messages import SystemMessage
+    from langchain_ollama import ChatOllama
+    
+    from src.database.graph_db import GraphDatabaseManager
+    from src.database.vector_db import VectorDatabaseManager
+
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional accelerator
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
 
-# Prompt for entity extraction from queries
-ENTITY_EXTRACTION_PROMPT = """You are an entity extraction system for supply chain analysis.
+# System prompt for entity extraction. It is sent unchanged on every call as
+# a separate chat message, so Ollama can reuse its cached KV prefix.
+ENTITY_EXTRACTION_SYSTEM_PROMPT = """You are an entity extraction system for supply chain analysis.
 Extract all named entities (companies, products, locations, events) from the user's question.
 
 Return ONLY a JSON array of entity names, nothing else.
 
 Example:
 Question: "How will the Singapore port strike affect GlobalTech's production?"
-Answer: ["Singapore", "GlobalTech"]
+Answer: ["Singapore", "GlobalTech"]"""
 
-Question: "{query}"
+# Per-query message for entity extraction
+ENTITY_EXTRACTION_QUERY_TEMPLATE = """Question: "{query}"
 Answer:"""
 
+# Message for extracting entities from several questions in one call. It uses
+# the same system prompt, so the cached prefix is shared with single queries.
+ENTITY_EXTRACTION_BATCH_TEMPLATE = """Extract the entities of each numbered question below.
+Return ONLY a JSON object mapping each question number to its JSON array of entity names,
+for example: {{"1": ["Singapore"], "2": []}}
+
+{questions}
+Answer:"""
+
+# Maximum number of neighbors returned per queried entity
+NEIGHBOR_LIMIT_PER_ENTITY = 10
+
+# Paths are searched between every pair of the first N extracted entities,
+# keeping the shortest few per pair
+PATH_SEARCH_MAX_ENTITIES = 4
+PATHS_PER_ENTITY_PAIR = 3
+
+# Seconds a graph health check result is reused for
+HEALTH_CHECK_TTL_SECONDS = 10.0
+
+# Characters that must be escaped inside a quoted Lucene phrase
+_LUCENE_PHRASE_ESCAPE_RE = re.compile(r'["\\]')
+
+# Separator between relationship types in formatted graph context
+_REL_SEPARATOR = " -> "
+
+# Worker threads per retriever for concurrent vector/graph lookups
+RETRIEVAL_WORKERS = 4
+
+# Entity extraction cache (LLM output does not depend on stored data)
+ENTITY_CACHE_SIZE = 1024
+ENTITY_CACHE_TTL_SECONDS = 3600.0
+
+# Retrieval result cache (short TTL, since stored data may change)
+RESULT_CACHE_SIZE = 2000
+RESULT_CACHE_TTL_SECONDS = 300.0
+
+# Query embedding cache (embeddings depend only on the text and model, so
+# they outlive retrieval results and survive invalidate())
+EMBEDDING_CACHE_SIZE = 5000
+EMBEDDING_CACHE_TTL_SECONDS = 3600.0
+
+# First JSON array in an LLM response. A negated character class stops at the
+# first closing bracket without backtracking, so trailing commentary containing
+# brackets is not swallowed into the match.
+_ENTITY_JSON_RE = re.compile(r"\[[^\]]*\]")
+
+# Outermost JSON object in a batched entity extraction response
+_ENTITY_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+# Process-wide graph manager (see _get_shared_graph)
+_shared_graph: Optional[GraphDatabaseManager] = None
+_shared_graph_lock = threading.Lock()
+
+
+def _dedupe_entities(entities: Iterable[str]) -> List[str]:
+    """
+    Remove blank and case-insensitive duplicate entity names.
+    
+    Args:
+        entities: Entity names as returned by the LLM
+        
+    Returns:
+        Stripped entity names, keeping the first spelling of each
+    """
+    unique: Dict[str, str] = {}
+    for entity in entities:
+        entity = entity.strip()
+        if entity:
+            unique.setdefault(entity.lower(), entity)
+    return list(unique.values())
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern a node name or relationship type.
+    
+    Graph results repeat the same few names and types across many rows;
+    interning makes every occurrence share one string object.
+    
+    Args:
+        value: Value read from a result row
+        
+    Returns:
+        The interned string, or the value unchanged if it is not a string
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _message_text(message: Any) -> str:
+    """
+    Get the text of a chat model response.
+    
+    Message content is either a string or a list of content blocks
+    (strings or dicts such as ``{"type": "text", "text": ...}``); only the
+    text parts are kept.
+    
+    Args:
+        message: Chat model response message
+        
+    Returns:
+        Response text
+    """
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else str(block.get("text", ""))
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
+
+
+def _fulltext_phrase(text: str) -> str:
+    """
+    Quote text as a Lucene phrase for a full-text index query.
+    
+    Args:
+        text: Raw entity name
+        
+    Returns:
+        Phrase query matching the entity's terms in order
+    """
+    return '"' + _LUCENE_PHRASE_ESCAPE_RE.sub(r"\\\g<0>", text) + '"'
+
+
+def _lookup_terms(entities: Iterable[str], indexed: bool) -> List[str]:
+    """
+    Turn entity names into the start node lookup terms of a graph query.
+    
+    Args:
+        entities: Entity names
+        indexed: Whether the query uses the entity name full-text index
+        
+    Returns:
+        Full-text phrases if indexed, otherwise the names themselves
+    """
+    if indexed:
+        return [_fulltext_phrase(entity) for entity in entities]
+    return list(entities)
+
+
+def _match_entity(node: str, term: str, indexed: bool) -> str:
+    """
+    Build the Cypher clause binding the nodes matching one lookup term.
+    
+    Without the full-text index, nodes are found by a case-insensitive
+    substring scan over every name (slow on large graphs, but correct).
+    
+    Args:
+        node: Variable to bind the matching nodes to
+        term: Cypher expression evaluating to the lookup term
+        indexed: Whether to query the entity name full-text index
+        
+    Returns:
+        Cypher clause; the indexed form expects an $index parameter
+    """
+    if indexed:
+        return f"CALL db.index.fulltext.queryNodes($index, {term}) YIELD node AS {node}"
+    return f"MATCH ({node}) WHERE toLower({node}.name) CONTAINS toLower({term})"
+
+
+def _neighbor_query(max_hops: int, indexed: bool = True) -> str:
+    """
+    Build the Cypher template for batched N-hop neighbor lookups.
+    
+    Only the hop count (which cannot be a parameter in a variable-length
+    pattern) and the lookup strategy are part of the text, so the variants
+    in use are built once (see _NEIGHBOR_QUERIES) and shared by all
+    retrievers.
+    
+    Args:
+        max_hops: Maximum path length
+        indexed: Whether start nodes are found through the full-text index
+        
+    Returns:
+        Cypher query expecting $index, $entities and $per_entity parameters;
+        each row also lists the $entities terms it was reached from
+    """
+    # The limit applies per entity inside the subquery, so entities with
+    # large neighborhoods cannot crowd out the rows of the others
+    return f"""
+    UNWIND $entities AS entity
+    CALL {{
+        WITH entity
+        {_match_entity("n", "entity", indexed)}
+        MATCH path = (n)-[*1..{max_hops}]-(neighbor)
+        WHERE neighbor <> n
+        WITH n.name AS source,
+             neighbor.name AS target,
+             [r IN relationships(path) | type(r)] AS relationships,
+             length(path) AS path_length
+        ORDER BY path_length
+        WITH source, target,
+             collect(relationships)[0] AS relationships,
+             min(path_length) AS path_length
+        RETURN source, target, relationships, path_length
+        ORDER BY path_length
+        LIMIT $per_entity
+    }}
+    WITH entity, source, target, relationships, path_length
+    ORDER BY path_length
+    WITH source, target,
+         collect(relationships)[0] AS relationships,
+         min(path_length) AS path_length,
+         collect(DISTINCT entity) AS entities
+    RETURN source, target, relationships, path_length, entities
+    ORDER BY path_length
+    """
+
+
+def _paths_query(max_hops: int, indexed: bool = True) -> str:
+    """
+    Build the Cypher template for batched shortest paths between entity pairs.
+    
+    Args:
+        max_hops: Maximum path length
+        indexed: Whether endpoints are found through the full-text index
+        
+    Returns:
+        Cypher query expecting $index, $pairs and $per_pair parameters
+    """
+    return f"""
+    UNWIND $pairs AS pair
+    {_match_entity("a", "pair[0]", indexed)}
+    {_match_entity("b", "pair[1]", indexed)}
+    WITH pair, a, b
+    WHERE a <> b
+    MATCH path = allShortestPaths((a)-[*..{max_hops}]-(b))
+    WITH pair, path
+    ORDER BY length(path)
+    WITH pair, collect(path)[..$per_pair] AS pair_paths
+    UNWIND pair_paths AS path
+    RETURN [n IN nodes(path) | n.name] AS nodes,
+           [r IN relationships(path) | type(r)] AS relationships,
+           length(path) AS path_length
+    ORDER BY path_length
+    """
+
+
+# Query texts keyed by (hop count, indexed) for the hop counts used in
+# practice, built once at import time so lookups are a plain dict access.
+# Other hop counts are built on first use and added. Path searches allow one
+# hop more than neighbors.
+_NEIGHBOR_QUERIES = {
+    (hops, indexed): _neighbor_query(hops, indexed)
+    for hops in range(1, 6) for indexed in (True, False)
+}
+_PATHS_QUERIES = {
+    (hops, indexed): _paths_query(hops, indexed)
+    for hops in range(2, 7) for indexed in (True, False)
+}
+
+
+def _get_shared_graph() -> GraphDatabaseManager:
+    """
+    Get the process-wide Neo4j connection manager.
+    
+    The Neo4j driver is thread-safe and pools its connections, so all
+    retrievers that were not given a manager share one instead of each
+    paying connection and authentication setup.
+    
+    Returns:
+        Shared GraphDatabaseManager
+    """
+    global _shared_graph
+    
+    with _shared_graph_lock:
+        if _shared_graph is None:
+            from src.database.graph_db import GraphDatabaseManager
+            _shared_graph = GraphDatabaseManager()
+        return _shared_graph
+
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model: str, base_url: str) -> ChatOllama:
+    """
+    Get a shared entity-extraction chat model client.
+    
+    Clients are cached per (model, base_url) so that every retriever in the
+    process reuses the same HTTP connection pool.
+    
+    Args:
+        model: Ollama model name
+        base_url: Ollama server URL
+        
+    Returns:
+        ChatOllama client
+    """
+    # Imported lazily so that importing this module (e.g. for the CLI)
+    # does not pay LangChain's start-up cost.
+    from langchain_ollama import ChatOllama
+    
+    return ChatOllama(model=model, base_url=base_url, temperature=0.0)
+
+
+def _save_caches_at_exit(retriever_ref: weakref.ref) -> None:
+    """
+    Save a retriever's caches at interpreter exit, if it is still alive.
+    
+    Only a weak reference is registered with atexit so that registration
+    does not keep retrievers alive.
+    
+    Args:
+        retriever_ref: Weak reference to a HybridRetriever
+    """
+    retriever = retriever_ref()
+    if retriever is not None:
+        retriever.save_caches()
+
+
+@functools.lru_cache(maxsize=1)
+def _entity_system_message() -> SystemMessage:
+    """
+    Get the shared entity extraction system message.
+    
+    Every extraction request (single or batched) starts with this same
+    message object, so the prompt prefix is byte-identical across calls and
+    retrievers and the model server can reuse its cached prefix.
+    
+    Returns:
+        SystemMessage holding ENTITY_EXTRACTION_SYSTEM_PROMPT
+    """
+    from langchain_core.messages import SystemMessage
+    
+    return SystemMessage(content=ENTITY_EXTRACTION_SYSTEM_PROMPT)
+
+
+class GraphEdge(NamedTuple):
+    """
+    A neighbor relationship found in the knowledge graph.
+    
+    Attributes:
+        source: Name of the entity the traversal started from
+        target: Name of the neighboring entity
+        relationships: Relationship types along the shortest path
+        path_length: Number of hops between source and target
+        entities: Queried entity lookup terms the row was reached from
+    """
+    source: str
+    target: str
+    relationships: Tuple[str, ...]
+    path_length: int
+    entities: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> GraphEdge:
+        """
+        Build an edge from a neighbor query result row.
+        
+        Names and relationship types are interned (see _intern).
+        
+        Args:
+            record: Row returned by the neighbor query
+            
+        Returns:
+            GraphEdge with missing values defaulted
+        """
+        return cls(
+            _intern(record.get("source") or ""),
+            _intern(record.get("target") or ""),
+            tuple(map(_intern, record.get("relationships") or ())),
+            record.get("path_length", 0),
+            tuple(record.get("entities") or ()),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class GraphPath:
     """
     Represents a path through the knowledge graph.
@@ -58,16 +458,16 @@ class GraphPath:
         if not self.nodes:
             return ""
         
-        parts = []
-        for i, node in enumerate(self.nodes):
-            parts.append(node)
-            if i < len(self.relationships):
-                parts.append(f"-[{self.relationships[i]}]->")
-        
-        return " ".join(parts)
+        # Interleave nodes with their outgoing relationships, then append
+        # any trailing nodes without one
+        arrows = (f"-[{rel}]->" for rel in self.relationships)
+        return " ".join(itertools.chain(
+            itertools.chain.from_iterable(zip(self.nodes, arrows, strict=False)),
+            self.nodes[len(self.relationships):],
+        ))
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalResult:
     """
     Result of hybrid retrieval containing both vector and graph context.
@@ -84,11 +484,39 @@ class RetrievalResult:
     graph_context: str = ""
     entities: List[str] = field(default_factory=list)
     graph_paths: List[GraphPath] = field(default_factory=list)
+    _combined_context: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def combined_context(self) -> str:
+        """
+        Combined vector and graph context, built on first access.
+        
+        The string is memoized per instance, so the fields should not be
+        modified after it has been read (dataclasses.replace() returns a
+        fresh instance with an empty memo).
+        
+        Returns:
+            Combined context for LLM consumption
+        """
+        if self._combined_context is None:
+            self._combined_context = self._build_combined_context()
+        return self._combined_context
     
     def get_combined_context(self) -> str:
         """
         Combine vector and graph context into a single context string.
         
+        Returns:
+            Combined context for LLM consumption
+        """
+        return self.combined_context
+    
+    def _build_combined_context(self) -> str:
+        """
+        Build the combined context string.
+        
         Returns:
             Combined context for LLM consumption
         """
@@ -96,8 +524,9 @@ class RetrievalResult:
         
         if self.vector_chunks:
             sections.append("## Relevant Documents")
-            for i, chunk in enumerate(self.vector_chunks, 1):
-                sections.append(f"{i}. {chunk}")
+            sections.extend(
+                f"{i}. {chunk}" for i, chunk in enumerate(self.vector_chunks, 1)
+            )
         
         if self.graph_context:
             sections.append("\n## Knowledge Graph Relationships")
@@ -105,8 +534,7 @@ class RetrievalResult:
         
         if self.graph_paths:
             sections.append("\n## Graph Paths")
-            for path in self.graph_paths:
-                sections.append(f"- {path.to_string()}")
+            sections.extend(f"- {path.to_string()}" for path in self.graph_paths)
         
         return "\n".join(sections)
 
@@ -117,10 +545,13 @@ class HybridRetriever:
     
     The retrieval process:
     1. Extract entities from the user query using LLM
-    2. Search ChromaDB for semantically similar documents
-    3. For each entity, find N-hop neighbors in Neo4j
+    2. Search ChromaDB for semantically similar documents (concurrently with 1)
+    3. Find N-hop neighbors of, and paths between, all entities in Neo4j
     4. Combine results into unified context
     
+    Lookups run on a small per-retriever thread pool; call close() (or use
+    the retriever as a context manager) to release it.
+    
     Example:
         retriever = HybridRetriever()
         result = retriever.retrieve(
@@ -139,208 +570,642 @@ class HybridRetriever:
         Initialize the hybrid retriever.
         
         Args:
-            graph_manager: Neo4j connection (created if not provided)
+            graph_manager: Neo4j connection (shared process-wide if not provided)
             vector_manager: ChromaDB manager (created if not provided)
             model: Ollama model for entity extraction
         """
         config = get_config()
         
-        self._graph = graph_manager or GraphDatabaseManager()
-        self._vector = vector_manager or VectorDatabaseManager()
+        # Database clients are imported lazily so that importing this module
+        # (e.g. for the CLI) does not pay their start-up cost.
+        if graph_manager is None:
+            graph_manager = _get_shared_graph()
+        if vector_manager is None:
+            from src.database.vector_db import VectorDatabaseManager
+            vector_manager = VectorDatabaseManager()
+        
+        self._graph = graph_manager
+        self._vector = vector_manager
+        
+        # Flush caches whenever either store is written through its manager
+        self._graph.add_invalidation_listener(self.invalidate)
+        self._vector.add_invalidation_listener(self.invalidate)
         self._model = model or config.ollama.model
         
-        self._llm = OllamaLLM(
-            model=self._model,
-            base_url=config.ollama.base_url,
-            temperature=0.0
-        )
+        self._llm = _get_llm(self._model, config.ollama.base_url)
+        self._system_message = _entity_system_message()
         
         self._vector_top_k = config.retrieval.vector_top_k
         self._max_hops = config.retrieval.graph_max_hops
         self._collection_name = config.chroma.collection_name
+        
+        # Worker threads for overlapping independent I/O-bound lookups
+        self._executor = ThreadPoolExecutor(
+            max_workers=RETRIEVAL_WORKERS, thread_name_prefix="atlas-retriever"
+        )
+        
+        # Caches keyed by normalized query (see QueryCache.make_key)
+        self._entity_cache = QueryCache(ENTITY_CACHE_SIZE, ttl=ENTITY_CACHE_TTL_SECONDS)
+        self._result_cache = QueryCache(RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL_SECONDS)
+        self._embed_cache = QueryCache(EMBEDDING_CACHE_SIZE, ttl=EMBEDDING_CACHE_TTL_SECONDS)
+        
+        # Graph context keyed by case-insensitive entity set
+        self._graph_cache = QueryCache(RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL_SECONDS)
+        
+        # Bumped by invalidate(); results computed under an older generation
+        # are returned but not cached, so a write during retrieval is not lost
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        
+        # Whether the entity name full-text index is online: None until the
+        # first graph lookup creates it, False if that failed
+        self._fulltext_index_ready: Optional[bool] = None
+        self._fulltext_index_lock = threading.Lock()
+        
+        # (timestamp, healthy) of the last graph health check
+        self._graph_health: Optional[Tuple[float, bool]] = None
+        
+        # Embedding indexes over cached queries, per include_graph mode, so
+        # paraphrases can reuse results (disabled unless a threshold is set)
+        threshold = config.retrieval.semantic_cache_threshold
+        self._semantic_indexes: Optional[Dict[bool, SemanticIndex]] = None
+        if threshold is not None:
+            self._semantic_indexes = {
+                include_graph: SemanticIndex(threshold, max_size=RESULT_CACHE_SIZE)
+                for include_graph in (True, False)
+            }
+        
+        # Have Ollama load both models before the first query needs them
+        if config.retrieval.preload_models:
+            self._executor.submit(self._warm_up)
+        
+        # Restore caches saved by earlier processes, and save them on exit
+        self._cache_path = config.retrieval.cache_path
+        self._atexit_hook: Optional[Callable[[], None]] = None
+        if self._cache_path is not None:
+            self._load_caches()
+            self._atexit_hook = functools.partial(_save_caches_at_exit, weakref.ref(self))
+            atexit.register(self._atexit_hook)
+    
+    def __enter__(self) -> HybridRetriever:
+        """Context manager entry."""
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_val: Optional[Exception],
+        exc_tb: Optional[Any]
+    ) -> None:
+        """Context manager exit - release worker threads."""
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Shut down the retriever's worker threads and save its caches.
+        
+        The retriever also stops listening for store changes, as the
+        (possibly shared) managers outlive it.
+        """
+        self._graph.remove_invalidation_listener(self.invalidate)
+        self._vector.remove_invalidation_listener(self.invalidate)
+        self._executor.shutdown(wait=True)
+        if self._atexit_hook is not None:
+            atexit.unregister(self._atexit_hook)
+            self._atexit_hook = None
+        self.save_caches()
+    
+    def _warm_up(self) -> None:
+        """
+        Make Ollama load the entity extraction and embedding models.
+        
+        Runs a throwaway extraction (which also caches the system prompt
+        prefix) and embedding. Failures are ignored, since the models are
+        simply loaded on first use instead.
+        """
+        try:
+            self._llm.invoke(self._entity_messages("warmup"))
+        except Exception as e:
+            logger.debug(f"LLM warm-up failed: {e}")
+        
+        try:
+            self._vector.embed("warmup")
+        except Exception as e:
+            logger.debug(f"Embedding warm-up failed: {e}")
+    
+    def _persistent_caches(self) -> Dict[str, QueryCache]:
+        """
+        Caches saved to RETRIEVAL_CACHE_PATH, by name.
+        
+        Only the model outputs are persisted, namespaced by the model that
+        produced them. Results and graph context depend on stored data,
+        which may change while no process is running.
+        """
+        return {
+            f"entities:{self._model}": self._entity_cache,
+            f"embeddings:{self._vector.embedding_model}": self._embed_cache,
+        }
+    
+    def _load_caches(self) -> None:
+        """Restore caches from the configured cache file."""
+        cache_path = self._cache_path
+        if cache_path is None:
+            return
+        
+        for name, cache in self._persistent_caches().items():
+            restored = cache.load(cache_path, name=name)
+            logger.debug(f"Restored {restored} cached {name} from {cache_path}")
+    
+    def save_caches(self) -> None:
+        """
+        Save caches to the configured cache file (no-op if none is set).
+        
+        Called automatically by close() and at interpreter exit.
+        """
+        if self._cache_path is None:
+            return
+        
+        try:
+            for name, cache in self._persistent_caches().items():
+                cache.save(self._cache_path, name=name)
+        except Exception as e:
+            logger.warning(f"Could not save caches to {self._cache_path}: {e}")
     
     def _extract_entities(self, query: str) -> List[str]:
         """
         Extract entity names from user query using LLM.
         
+        Results are memoized per normalized query, so repeated questions
+        (e.g. Streamlit reruns) skip the LLM round-trip.
+        
         Args:
             query: User's question
             
         Returns:
             List of entity names
         """
-        prompt = ENTITY_EXTRACTION_PROMPT.format(query=query)
-        
-        try:
-            response = self._llm.invoke(prompt)
-            
-            # Parse JSON array from response
-            json_match = re.search(r"\[.*\]", response, re.DOTALL)
-            if json_match:
-                entities = json.loads(json_match.group())
-                if isinstance(entities, list):
-                    return [str(e) for e in entities]
-            
-            logger.warning(f"Could not parse entities from: {response}")
-            return []
-            
-        except Exception as e:
-            logger.error(f"Entity extraction failed: {e}")
-            return []
+        return self._lookup_entities(query) or []
     
-    def _retrieve_vector(
-        self,
-        query: str,
-        n_results: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    def _lookup_entities(self, query: str) -> Optional[List[str]]:
         """
-        Retrieve similar documents from vector store.
+        Extract entity names from a query, reporting failures.
         
         Args:
-            query: Search query
-            n_results: Number of results (defaults to config)
+            query: User's question
             
         Returns:
-            List of similar documents
+            List of entity names, or None if extraction failed
         """
-        try:
-            return self._vector.query_similar(
-                collection_name=self._collection_name,
-                query_text=query,
-                n_results=n_results or self._vector_top_k
-            )
-        except Exception as e:
-            logger.error(f"Vector retrieval failed: {e}")
-            return []
+        cached = self._get_cached_entities(query)
+        if cached is not None:
+            return cached
+        
+        return self._cache_entities(query, self._invoke_entity_extraction(query))
     
-    def _build_neighbor_query(self, entity: str, max_hops: int = 2) -> str:
+    def _get_cached_entities(self, query: str) -> Optional[List[str]]:
         """
-        Build Cypher query to find neighbors of an entity.
+        Look up the cached entities of a query.
         
         Args:
-            entity: Entity name to search from
-            max_hops: Maximum path length
+            query: User's question
             
         Returns:
-            Cypher query string
-        """
-        return f"""
-        MATCH (n)
-        WHERE n.name =~ '(?i).*{entity}.*'
-        MATCH path = (n)-[*1..{max_hops}]-(neighbor)
-        WHERE neighbor <> n
-        RETURN DISTINCT n.name AS source, 
-               neighbor.name AS target,
-               [r IN relationships(path) | type(r)] AS relationships,
-               length(path) AS path_length
-        ORDER BY path_length
-        LIMIT 10
+            Copy of the cached entity names, or None if not cached
         """
+        cached = self._entity_cache.get(QueryCache.make_key(query))
+        return None if cached is None else list(cached)
     
-    def _retrieve_graph_neighbors(
+    def _cache_entities(
         self,
-        entity: str,
-        max_hops: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+        query: str,
+        entities: Optional[List[str]]
+    ) -> Optional[List[str]]:
         """
-        Find entities within N hops of the given entity.
+        Cache the entities extracted from a query (failed extractions are not cached).
         
         Args:
-            entity: Entity name to start from
-            max_hops: Maximum hops (defaults to config)
+            query: User's question
+            entities: Extracted entity names, or None if extraction failed
             
         Returns:
-            List of neighbor information
+            Copy of the entity names, or None if extraction failed
         """
-        try:
-            # First try to find the exact entity
-            query = self._build_neighbor_query(entity, max_hops or self._max_hops)
-            return self._graph.execute_query(query)
-        except Exception as e:
-            logger.error(f"Graph neighbor retrieval failed: {e}")
-            return []
+        if entities is None:
+            return None
+        
+        self._entity_cache.put(QueryCache.make_key(query), entities)
+        return list(entities)
     
-    def _get_paths_between_entities(
-        self,
-        entities: List[str]
-    ) -> List[GraphPath]:
+    def _invoke_entity_extraction(self, query: str) -> Optional[List[str]]:
         """
-        Find paths connecting multiple entities.
+        Ask the LLM for the entities in a query.
         
         Args:
-            entities: List of entity names
+            query: User's question
             
         Returns:
-            List of paths between entities
+            List of entity names, or None if extraction failed
         """
-        paths = []
-        
-        if len(entities) < 2:
-            return paths
-        
         try:
-            # Try to find paths between first two entities
-            query = f"""
-            MATCH (a), (b)
-            WHERE a.name =~ '(?i).*{entities[0]}.*'
-              AND b.name =~ '(?i).*{entities[1]}.*'
-            MATCH path = shortestPath((a)-[*..{self._max_hops + 1}]-(b))
-            RETURN [n IN nodes(path) | n.name] AS nodes,
-                   [r IN relationships(path) | type(r)] AS relationships,
-                   length(path) AS path_length
-            LIMIT 3
-            """
-            
-            results = self._graph.execute_query(query)
-            
-            for result in results:
-                paths.append(GraphPath(
-                    nodes=result.get("nodes", []),
-                    relationships=result.get("relationships", []),
-                    path_length=result.get("path_length", 0)
-                ))
-                
+            response = _message_text(self._llm.invoke(self._entity_messages(query)))
+            return self._parse_entities(response)
         except Exception as e:
-            logger.warning(f"Path finding failed: {e}")
-        
-        return paths
+            logger.error(f"Entity extraction failed: {e}")
+            return None
     
-    def _format_graph_context(
-        self,
-        neighbors: List[Dict[str, Any]],
-        paths: List[GraphPath]
-    ) -> str:
+    async def _alookup_entities(self, query: str) -> Optional[List[str]]:
         """
-        Format graph results into readable context.
+        Extract entity names from a query asynchronously, reporting failures.
+        
+        Shares the entity cache with _lookup_entities().
         
         Args:
-            neighbors: Neighbor query results
-            paths: Paths between entities
+            query: User's question
             
         Returns:
-            Formatted context string
+            List of entity names, or None if extraction failed
         """
-        lines = []
-        
-        # Format neighbor relationships
-        seen = set()
-        for neighbor in neighbors:
-            source = neighbor.get("source", "")
-            target = neighbor.get("target", "")
-            rels = neighbor.get("relationships", [])
-            
-            if source and target:
-                key = f"{source}-{target}"
-                if key not in seen:
-                    seen.add(key)
-                    rel_str = " -> ".join(rels) if rels else "RELATED"
-                    lines.append(f"- {source} --[{rel_str}]--> {target}")
-        
-        # Format paths
-        for path in paths:
-            lines.append(f"- Path: {path.to_string()}")
+        cached = self._get_cached_entities(query)
+        if cached is not None:
+            return cached
         
-        return "\n".join(lines)
+        return self._cache_entities(query, await self._ainvoke_entity_extraction(query))
+    
+    async def _ainvoke_entity_extraction(self, query: str) -> Optional[List[str]]:
+        """
+        Ask the LLM for the entities in a query, asynchronously.
+        
+        Args:
+            query: User's question
+            
+        Returns:
+            List of entity names, or None if extraction failed
+        """
+        try:
+            response = _message_text(await self._llm.ainvoke(self._entity_messages(query)))
+            return self._parse_entities(response)
+        except Exception as e:
+            logger.error(f"Entity extraction failed: {e}")
+            return None
+    
+    def _entity_messages(self, query: str) -> List[Any]:
+        """
+        Build the chat messages for extracting the entities of one query.
+        
+        Args:
+            query: User's question
+            
+        Returns:
+            Shared system message followed by the question
+        """
+        from langchain_core.messages import HumanMessage
+        
+        return [
+            self._system_message,
+            HumanMessage(content=ENTITY_EXTRACTION_QUERY_TEMPLATE.format(query=query)),
+        ]
+    
+    @staticmethod
+    def _parse_entities(response: str) -> Optional[List[str]]:
+        """
+        Parse the JSON array of entity names from an LLM response.
+        
+        Args:
+            response: LLM response text
+            
+        Returns:
+            Deduplicated entity names, or None if no array was found
+        """
+        json_match = _ENTITY_JSON_RE.search(response)
+        if json_match:
+            entities = _json_loads(json_match.group())
+            if isinstance(entities, list):
+                return _dedupe_entities(str(e) for e in entities)
+        
+        logger.warning(f"Could not parse entities from: {response}")
+        return None
+    
+    def _extract_entities_batch(
+        self,
+        queries: Sequence[str]
+    ) -> List[Optional[List[str]]]:
+        """
+        Extract entity names from several queries with one LLM call.
+        
+        Cached queries are answered from the entity cache. The remaining
+        ones are sent in a single numbered prompt; any query whose entities
+        cannot be read from the response is extracted on its own.
+        
+        Args:
+            queries: User questions
+            
+        Returns:
+            List of entity names per query (None where extraction failed),
+            in input order
+        """
+        keys = [QueryCache.make_key(query) for query in queries]
+        
+        found: Dict[str, Optional[List[str]]] = {}
+        pending: Dict[str, str] = {}
+        for key, query in zip(keys, queries, strict=True):
+            if key in found or key in pending:
+                continue
+            cached = self._entity_cache.get(key)
+            if cached is not None:
+                found[key] = cached
+            else:
+                pending[key] = query
+        
+        if len(pending) > 1:
+            batch = self._invoke_entity_extraction_batch(list(pending.values())) or {}
+            for i, key in enumerate(list(pending), 1):
+                if i in batch:
+                    self._entity_cache.put(key, batch[i])
+                    found[key] = batch[i]
+                    del pending[key]
+        
+        if pending:
+            for key, entities in zip(
+                pending,
+                self._executor.map(self._lookup_entities, pending.values()),
+                strict=True,
+            ):
+                found[key] = entities
+        
+        return [None if (entities := found[key]) is None else list(entities) for key in keys]
+    
+    def _invoke_entity_extraction_batch(
+        self,
+        queries: List[str]
+    ) -> Optional[Dict[int, List[str]]]:
+        """
+        Ask the LLM for the entities in several queries at once.
+        
+        Args:
+            queries: User questions
+            
+        Returns:
+            Entity names keyed by 1-based query position (positions missing
+            from the response are omitted), or None if extraction failed
+        """
+        from langchain_core.messages import HumanMessage
+        
+        questions = "\n".join(f'{i}. "{query}"' for i, query in enumerate(queries, 1))
+        messages = [
+            self._system_message,
+            HumanMessage(content=ENTITY_EXTRACTION_BATCH_TEMPLATE.format(questions=questions)),
+        ]
+        
+        try:
+            response = _message_text(self._llm.invoke(messages))
+            
+            json_match = _ENTITY_JSON_OBJECT_RE.search(response)
+            if json_match:
+                parsed = _json_loads(json_match.group())
+                if isinstance(parsed, dict):
+                    return {
+                        i: _dedupe_entities(str(e) for e in entities)
+                        for i in range(1, len(queries) + 1)
+                        if isinstance(entities := parsed.get(str(i)), list)
+                    }
+            
+            logger.warning(f"Could not parse batched entities from: {response}")
+            return None
+            
+        except Exception as e:
+            logger.error(f"Batched entity extraction failed: {e}")
+            return None
+    
+    def _query_vector(
+        self,
+        query: str,
+        n_results: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve similar documents from vector store.
+        
+        Args:
+            query: Search query
+            n_results: Number of results (defaults to config)
+            
+        Returns:
+            List of similar documents, or None if the search failed
+        """
+        try:
+            return self._vector.query_similar(
+                collection_name=self._collection_name,
+                query_text=query,
+                n_results=n_results or self._vector_top_k,
+                query_embedding=self._embed_query(query)
+            )
+        except Exception as e:
+            logger.error(f"Vector retrieval failed: {e}")
+            return None
+    
+    def _embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embed a query, reusing cached embeddings for repeated text.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Embedding vector, or None if embedding failed (the vector store
+            then embeds the query text itself)
+        """
+        cache_key = QueryCache.make_key(query)
+        embedding: Optional[List[float]] = self._embed_cache.get(cache_key)
+        if embedding is not None:
+            return embedding
+        
+        try:
+            embedding = self._vector.embed(query)
+        except Exception as e:
+            logger.warning(f"Query embedding failed: {e}")
+            return None
+        
+        self._embed_cache.put(cache_key, embedding)
+        return embedding
+    
+    def _ensure_fulltext_index(self) -> bool:
+        """
+        Create the entity name full-text index once per retriever.
+        
+        Creation runs under a lock and waits until the index is online, so
+        concurrent lookups never query an index that is missing or still
+        populating. A failure (e.g. a read-only user) is recorded too, so it
+        does not cost an extra round trip and warning on every lookup; graph
+        queries then scan node names instead.
+        
+        Returns:
+            True if lookups should use the index
+        """
+        ready = self._fulltext_index_ready
+        if ready is not None:
+            return ready
+        
+        with self._fulltext_index_lock:
+            if self._fulltext_index_ready is None:
+                try:
+                    self._graph.ensure_fulltext_index()
+                    self._fulltext_index_ready = True
+                except Exception as e:
+                    logger.warning(
+                        f"Full-text index unavailable, falling back to name scans: {e}"
+                    )
+                    self._fulltext_index_ready = False
+            return self._fulltext_index_ready
+    
+    def _build_neighbor_query(
+        self,
+        entities: Union[str, Sequence[str]],
+        max_hops: int = 2,
+        indexed: bool = True
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build Cypher query to find neighbors of one or more entities.
+        
+        All entities are looked up in a single statement via ``UNWIND``,
+        so a query with k entities costs one round-trip instead of k.
+        Start nodes are found through the entity name full-text index
+        rather than by scanning every node, unless the index is unavailable.
+        Each entity contributes at most
+        NEIGHBOR_LIMIT_PER_ENTITY rows, and rows are deduplicated per
+        (source, target) pair in the database, keeping the relationships
+        of the shortest path. Entities are passed as query parameters and
+        the query text is shared per hop count (see _NEIGHBOR_QUERIES), so
+        Neo4j can reuse the cached plan.
+        
+        Args:
+            entities: Entity name (or names) to search from
+            max_hops: Maximum path length
+            indexed: Whether to look start nodes up in the full-text index
+            
+        Returns:
+            Tuple of (Cypher query string, query parameters)
+        """
+        if isinstance(entities, str):
+            entities = [entities]
+        
+        from src.database.graph_db import ENTITY_NAME_INDEX
+        
+        key = (int(max_hops), indexed)
+        query = _NEIGHBOR_QUERIES.get(key)
+        if query is None:
+            query = _NEIGHBOR_QUERIES.setdefault(key, _neighbor_query(*key))
+        params = {
+            "index": ENTITY_NAME_INDEX,
+            "entities": _lookup_terms(entities, indexed),
+            "per_entity": NEIGHBOR_LIMIT_PER_ENTITY,
+        }
+        return query, params
+    
+    def _query_graph_neighbors(
+        self,
+        entities: Union[str, Sequence[str]],
+        max_hops: Optional[int] = None
+    ) -> Optional[List[GraphEdge]]:
+        """
+        Find entities within N hops of the given entities.
+        
+        Args:
+            entities: Entity name (or names) to start from
+            max_hops: Maximum hops (defaults to config)
+            
+        Returns:
+            List of neighbor edges, or None if the query failed
+        """
+        try:
+            query, params = self._build_neighbor_query(
+                entities, max_hops or self._max_hops, self._ensure_fulltext_index()
+            )
+            return [
+                GraphEdge.from_record(record)
+                for record in self._graph.execute_query(query, params)
+            ]
+        except Exception as e:
+            logger.error(f"Graph neighbor retrieval failed: {e}")
+            return None
+    
+    def _query_paths_between_entities(
+        self,
+        entities: List[str]
+    ) -> Optional[List[GraphPath]]:
+        """
+        Find paths connecting multiple entities.
+        
+        Every pair among the first PATH_SEARCH_MAX_ENTITIES entities is
+        searched in a single batched query. ``allShortestPaths`` is used so
+        that up to PATHS_PER_ENTITY_PAIR distinct paths are returned per
+        pair (``shortestPath`` only ever yields one).
+        
+        Args:
+            entities: List of entity names
+            
+        Returns:
+            List of paths between entities, or None if the query failed
+        """
+        paths: List[GraphPath] = []
+        
+        if len(entities) < 2:
+            return paths
+        
+        try:
+            from src.database.graph_db import ENTITY_NAME_INDEX
+            
+            key = (int(self._max_hops) + 1, self._ensure_fulltext_index())
+            query = _PATHS_QUERIES.get(key)
+            if query is None:
+                query = _PATHS_QUERIES.setdefault(key, _paths_query(*key))
+            terms = _lookup_terms(entities[:PATH_SEARCH_MAX_ENTITIES], key[1])
+            pairs = [list(pair) for pair in itertools.combinations(terms, 2)]
+            
+            results = self._graph.execute_query(
+                query,
+                {"index": ENTITY_NAME_INDEX, "pairs": pairs, "per_pair": PATHS_PER_ENTITY_PAIR},
+            )
+            
+            for result in results:
+                paths.append(GraphPath(
+                    nodes=[_intern(node) for node in result.get("nodes", [])],
+                    relationships=[_intern(rel) for rel in result.get("relationships", [])],
+                    path_length=result.get("path_length", 0)
+                ))
+                
+        except Exception as e:
+            logger.warning(f"Path finding failed: {e}")
+            return None
+        
+        return paths
+    
+    def _format_graph_context(
+        self,
+        neighbors: List[GraphEdge],
+        paths: List[GraphPath]
+    ) -> str:
+        """
+        Format graph results into readable context.
+        
+        Args:
+            neighbors: Neighbor edges
+            paths: Paths between entities
+            
+        Returns:
+            Formatted context string
+        """
+        lines = []
+        
+        # Format neighbor relationships (already unique per source/target,
+        # see _build_neighbor_query)
+        for source, target, rels, _, _ in neighbors:
+            if source and target:
+                rel_str = _REL_SEPARATOR.join(rels) if rels else "RELATED"
+                lines.append(f"- {source} --[{rel_str}]--> {target}")
+        
+        # Format paths
+        lines.extend(f"- Path: {path.to_string()}" for path in paths)
+        
+        return "\n".join(lines)
     
     def retrieve(
         self,
@@ -350,6 +1215,45 @@ class HybridRetriever:
         """
         Perform hybrid retrieval combining vector and graph search.
         
+        Results are cached per normalized query for RESULT_CACHE_TTL_SECONDS
+        (unless entity extraction, vector or graph lookup failed); use
+        invalidate() after modifying the underlying stores. If
+        RETRIEVAL_SEMANTIC_CACHE_THRESHOLD is set, a cached result is also
+        reused for queries whose embedding is at least that similar.
+        
+        Args:
+            query: User's question
+            include_graph: Whether to include graph traversal
+            
+        Returns:
+            RetrievalResult with combined context
+        """
+        generation = self._generation
+        
+        cached: Optional[RetrievalResult] = self._result_cache.get(
+            (include_graph, QueryCache.make_key(query))
+        )
+        if cached is not None:
+            return replace(cached, query=query)
+        
+        result, cacheable = self._retrieve_uncached(query, include_graph, generation)
+        if cacheable:
+            self._cache_result(query, include_graph, result, generation)
+        return replace(result)
+    
+    async def aretrieve(
+        self,
+        query: str,
+        include_graph: bool = True
+    ) -> RetrievalResult:
+        """
+        Perform hybrid retrieval asynchronously.
+        
+        Same results and caching as retrieve(). Entity extraction awaits
+        the LLM directly; the vector and graph clients are synchronous, so
+        their calls run on the retriever's worker threads while the event
+        loop serves other requests.
+        
         Args:
             query: User's question
             include_graph: Whether to include graph traversal
@@ -357,39 +1261,587 @@ class HybridRetriever:
         Returns:
             RetrievalResult with combined context
         """
+        loop = asyncio.get_running_loop()
+        generation = self._generation
+        
+        cached: Optional[RetrievalResult] = self._result_cache.get(
+            (include_graph, QueryCache.make_key(query))
+        )
+        if cached is not None:
+            return replace(cached, query=query)
+        
         result = RetrievalResult(query=query)
+        vector_future = loop.run_in_executor(
+            self._executor, self._match_or_query_vector, query, include_graph
+        )
+        complete = True
         
-        # Step 1: Extract entities from query
         if include_graph:
-            entities = self._extract_entities(query)
-            result.entities = entities
-            logger.info(f"Extracted entities: {entities}")
+            entities = await self._alookup_entities(query)
+            complete = entities is not None
+            result.entities = entities or []
+            logger.info(f"Extracted entities: {result.entities}")
+            
+            # A semantic match makes the graph lookups unnecessary
+            if vector_future.done() and (match := vector_future.result()[0]) is not None:
+                return replace(match, query=query)
+            
+            if result.entities:
+                result.graph_context, result.graph_paths, graph_complete = (
+                    await self._aretrieve_graph_for_entities(result.entities, generation)
+                )
+                complete = complete and graph_complete
+        
+        match, vector_docs = await vector_future
+        if match is not None:
+            return replace(match, query=query)
+        result.vector_chunks = self._collect_chunks(vector_docs or [])
+        
+        if not complete or vector_docs is None:
+            return replace(result)
+        if self._semantic_indexes is None:
+            self._cache_result(query, include_graph, result, generation)
         else:
-            entities = []
-        
-        # Step 2: Vector retrieval
-        vector_docs = self._retrieve_vector(query)
-        result.vector_chunks = [
-            doc.get("document", "") 
-            for doc in vector_docs 
-            if doc.get("document")
+            await loop.run_in_executor(
+                self._executor, self._cache_result, query, include_graph, result, generation
+            )
+        return replace(result)
+    
+    def _get_cached_result(
+        self,
+        query: str,
+        include_graph: bool
+    ) -> Optional[RetrievalResult]:
+        """
+        Look up a cached result for a query, exactly or semantically.
+        
+        Args:
+            query: User's question
+            include_graph: Whether to include graph traversal
+            
+        Returns:
+            Cached RetrievalResult, or None
+        """
+        cached = self._result_cache.get((include_graph, QueryCache.make_key(query)))
+        if cached is None and self._semantic_indexes is not None:
+            cached = self._get_semantic_match(query, include_graph)
+        return cached
+    
+    def _cache_result(
+        self,
+        query: str,
+        include_graph: bool,
+        result: RetrievalResult,
+        generation: int
+    ) -> None:
+        """
+        Store a retrieval result, indexing its query embedding if enabled.
+        
+        Nothing is stored if the caches were invalidated since the
+        retrieval started, as the result may predate the change.
+        
+        Args:
+            query: User's question
+            include_graph: Whether graph traversal was included
+            result: Result to cache
+            generation: Value of self._generation when the retrieval started
+        """
+        cache_key = (include_graph, QueryCache.make_key(query))
+        indexes = self._semantic_indexes
+        embedding = None if indexes is None else self._embed_query(query)
+        
+        with self._generation_lock:
+            if generation != self._generation:
+                return
+            
+            self._result_cache.put(cache_key, result)
+            if indexes is not None and embedding is not None:
+                indexes[include_graph].add(cache_key, embedding)
+    
+    def _match_or_query_vector(
+        self,
+        query: str,
+        include_graph: bool
+    ) -> Tuple[Optional[RetrievalResult], Optional[List[Dict[str, Any]]]]:
+        """
+        Find a cached result for a similar query, or else search the vector store.
+        
+        Both steps use the same (cached) query embedding, so running this on
+        a worker overlaps the embedding with entity extraction.
+        
+        Args:
+            query: User's question
+            include_graph: Whether to include graph traversal
+            
+        Returns:
+            Tuple of (cached RetrievalResult of a similar query, or None;
+            similar documents, or None if there was a match or the search
+            failed)
+        """
+        if self._semantic_indexes is not None:
+            match = self._get_semantic_match(query, include_graph)
+            if match is not None:
+                return match, None
+        
+        return None, self._query_vector(query)
+    
+    def _get_semantic_match(
+        self,
+        query: str,
+        include_graph: bool
+    ) -> Optional[RetrievalResult]:
+        """
+        Find a cached result for a query similar to the given one.
+        
+        The query embedding is cached, so it is reused by the vector search
+        if no match is found.
+        
+        Args:
+            query: User's question
+            include_graph: Whether to include graph traversal
+            
+        Returns:
+            Cached RetrievalResult of a similar query, or None
+        """
+        indexes = self._semantic_indexes
+        if indexes is None:
+            return None
+        
+        embedding = self._embed_query(query)
+        if embedding is None:
+            return None
+        
+        similar_key = indexes[include_graph].lookup(embedding)
+        if similar_key is None:
+            return None
+        
+        return self._result_cache.get(similar_key)
+    
+    def _retrieve_uncached(
+        self,
+        query: str,
+        include_graph: bool,
+        generation: int
+    ) -> Tuple[RetrievalResult, bool]:
+        """
+        Perform hybrid retrieval without consulting the exact result cache.
+        
+        Semantic matches (if enabled) are looked up on a worker together
+        with the vector search, while entities are extracted; the
+        extraction is simply discarded on a match.
+        
+        Args:
+            query: User's question
+            include_graph: Whether to include graph traversal
+            generation: Value of self._generation when the retrieval started
+            
+        Returns:
+            Tuple of (RetrievalResult with combined context, whether it
+            should be cached: every lookup succeeded and it was not taken
+            from the semantic cache)
+        """
+        result = RetrievalResult(query=query)
+        
+        if not include_graph:
+            match, vector_docs = self._match_or_query_vector(query, include_graph)
+            if match is not None:
+                return replace(match, query=query), False
+            result.vector_chunks = self._collect_chunks(vector_docs or [])
+            return result, vector_docs is not None
+        
+        # Vector search does not depend on the extracted entities, so run it
+        # in the background while the LLM extracts entities and the graph is
+        # queried. Latency becomes max(vector, LLM + graph) instead of the sum.
+        vector_future = self._executor.submit(self._match_or_query_vector, query, include_graph)
+        
+        # Step 1: Extract entities from query
+        entities = self._lookup_entities(query)
+        complete = entities is not None
+        result.entities = entities or []
+        logger.info(f"Extracted entities: {result.entities}")
+        
+        # A semantic match makes the graph lookups unnecessary
+        if vector_future.done() and (match := vector_future.result()[0]) is not None:
+            return replace(match, query=query), False
+        
+        # Step 2: Graph neighbors and paths between entities
+        if result.entities:
+            result.graph_context, result.graph_paths, graph_complete = (
+                self._retrieve_graph_for_entities(result.entities, generation)
+            )
+            complete = complete and graph_complete
+        
+        # Step 3: Join the vector retrieval
+        match, vector_docs = vector_future.result()
+        if match is not None:
+            return replace(match, query=query), False
+        result.vector_chunks = self._collect_chunks(vector_docs or [])
+        
+        return result, complete and vector_docs is not None
+    
+    async def _aretrieve_graph_for_entities(
+        self,
+        entities: List[str],
+        generation: int
+    ) -> Tuple[str, List[GraphPath], bool]:
+        """
+        Asynchronous variant of _retrieve_graph_for_entities().
+        
+        Neighbors and paths are fetched as two separate worker tasks, so no
+        worker ever blocks waiting on another one.
+        
+        Args:
+            entities: Entity names
+            generation: Value of self._generation when the retrieval started
+            
+        Returns:
+            Tuple of (formatted graph context, paths between entities,
+            whether both lookups succeeded)
+        """
+        cache_key = self._graph_cache_key(entities)
+        
+        cached = self._get_cached_graph(cache_key)
+        if cached is not None:
+            return cached
+        
+        loop = asyncio.get_running_loop()
+        neighbors, paths = await asyncio.gather(
+            loop.run_in_executor(self._executor, self._query_graph_neighbors, entities),
+            loop.run_in_executor(self._executor, self._query_paths_between_entities, entities),
+        )
+        
+        return self._cache_graph(cache_key, neighbors, paths, generation)
+    
+    def _retrieve_graph_for_entities(
+        self,
+        entities: List[str],
+        generation: int
+    ) -> Tuple[str, List[GraphPath], bool]:
+        """
+        Retrieve formatted graph context and paths for a set of entities.
+        
+        Results are cached per case-insensitive entity set, so different
+        questions about the same entities share one graph traversal.
+        
+        Args:
+            entities: Entity names
+            generation: Value of self._generation when the retrieval started
+            
+        Returns:
+            Tuple of (formatted graph context, paths between entities,
+            whether both lookups succeeded)
+        """
+        cache_key = self._graph_cache_key(entities)
+        
+        cached = self._get_cached_graph(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Find paths between entities in the background while the neighbors
+        # of all entities are fetched in one batched query
+        paths_future = self._executor.submit(self._query_paths_between_entities, entities)
+        neighbors = self._query_graph_neighbors(entities)
+        paths = paths_future.result()
+        
+        return self._cache_graph(cache_key, neighbors, paths, generation)
+    
+    @staticmethod
+    def _graph_cache_key(entities: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Build the graph cache key of a set of entities.
+        
+        Args:
+            entities: Entity names
+            
+        Returns:
+            Sorted, lowercased entity names
+        """
+        return tuple(sorted(entity.lower() for entity in entities))
+    
+    def _get_cached_graph(
+        self,
+        cache_key: Tuple[str, ...]
+    ) -> Optional[Tuple[str, List[GraphPath], bool]]:
+        """
+        Look up cached graph context.
+        
+        Args:
+            cache_key: Key from _graph_cache_key()
+            
+        Returns:
+            Tuple of (formatted graph context, copy of the paths, True), or None
+        """
+        cached = self._graph_cache.get(cache_key)
+        if cached is None:
+            return None
+        
+        context, paths = cached
+        return context, list(paths), True
+    
+    def _cache_graph(
+        self,
+        cache_key: Tuple[str, ...],
+        neighbors: Optional[List[GraphEdge]],
+        paths: Optional[List[GraphPath]],
+        generation: int
+    ) -> Tuple[str, List[GraphPath], bool]:
+        """
+        Format and cache the graph context of a set of entities.
+        
+        The context is only cached if both lookups succeeded, so a Neo4j
+        error does not leave an empty context behind for the cache TTL,
+        and if the caches were not invalidated since the retrieval started.
+        
+        Args:
+            cache_key: Key from _graph_cache_key()
+            neighbors: Neighbor edges, or None if their lookup failed
+            paths: Paths between entities, or None if their lookup failed
+            generation: Value of self._generation when the retrieval started
+            
+        Returns:
+            Tuple of (formatted graph context, copy of the paths, whether
+            both lookups succeeded)
+        """
+        context = self._format_graph_context(neighbors or [], paths or [])
+        if neighbors is None or paths is None:
+            return context, list(paths or []), False
+        
+        with self._generation_lock:
+            if generation == self._generation:
+                self._graph_cache.put(cache_key, (context, paths))
+        return context, list(paths), True
+    
+    def batch_retrieve(self, queries: Sequence[str]) -> List[RetrievalResult]:
+        """
+        Perform hybrid retrieval for several queries at once.
+        
+        Duplicate and cached queries are answered from the result cache
+        (including semantic matches, like retrieve()). For the rest,
+        entities are extracted with one LLM call, the neighbors of all their
+        entities are fetched in one graph query and the vector store is
+        searched in one call.
+        
+        Args:
+            queries: User questions
+            
+        Returns:
+            One RetrievalResult per query, in input order
+        """
+        generation = self._generation
+        keys = [QueryCache.make_key(query) for query in queries]
+        
+        results: Dict[str, RetrievalResult] = {}
+        pending: Dict[str, str] = {}
+        for key, query in zip(keys, queries, strict=True):
+            if key in results or key in pending:
+                continue
+            cached = self._get_cached_result(query, True)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = query
+        
+        if pending:
+            fresh = self._batch_retrieve_uncached(list(pending.values()), generation)
+            for (key, query), (result, complete) in zip(pending.items(), fresh, strict=True):
+                if complete:
+                    self._cache_result(query, True, result, generation)
+                results[key] = result
+        
+        return [
+            replace(results[key], query=query)
+            for key, query in zip(keys, queries, strict=True)
+        ]
+    
+    def _batch_retrieve_uncached(
+        self,
+        queries: List[str],
+        generation: int
+    ) -> List[Tuple[RetrievalResult, bool]]:
+        """
+        Perform hybrid retrieval for distinct queries without the result cache.
+        
+        Args:
+            queries: User questions
+            generation: Value of self._generation when the retrieval started
+            
+        Returns:
+            One tuple of (RetrievalResult, whether every lookup succeeded)
+            per query, in input order
+        """
+        vector_future = self._executor.submit(self._retrieve_vector_batch, queries)
+        
+        entity_lists = self._extract_entities_batch(queries)
+        graph = self._retrieve_graph_batch(
+            [entities or [] for entities in entity_lists], generation
+        )
+        
+        vector_results = vector_future.result()
+        vector_complete = vector_results is not None
+        if vector_results is None:
+            vector_results = [[] for _ in queries]
+        
+        results = []
+        for query, entities, (context, paths, graph_complete), vector_docs in zip(
+            queries, entity_lists, graph, vector_results, strict=True
+        ):
+            results.append((
+                RetrievalResult(
+                    query=query,
+                    vector_chunks=self._collect_chunks(vector_docs),
+                    graph_context=context,
+                    entities=entities or [],
+                    graph_paths=paths
+                ),
+                vector_complete and entities is not None and graph_complete,
+            ))
+        
+        return results
+    
+    def _retrieve_vector_batch(
+        self,
+        queries: List[str]
+    ) -> Optional[List[List[Dict[str, Any]]]]:
+        """
+        Retrieve similar documents for several queries in one vector search.
+        
+        Args:
+            queries: Search queries
+            
+        Returns:
+            One list of similar documents per query, or None if the search
+            failed
+        """
+        embeddings = [
+            embedding for query in queries
+            if (embedding := self._embed_query(query)) is not None
         ]
         
-        # Step 3: Graph retrieval for each entity
-        if entities:
-            all_neighbors = []
-            for entity in entities:
-                neighbors = self._retrieve_graph_neighbors(entity)
-                all_neighbors.extend(neighbors)
+        try:
+            return self._vector.query_similar_batch(
+                collection_name=self._collection_name,
+                query_texts=queries,
+                n_results=self._vector_top_k,
+                query_embeddings=embeddings if len(embeddings) == len(queries) else None
+            )
+        except Exception as e:
+            logger.error(f"Batch vector retrieval failed: {e}")
+            return None
+    
+    def _retrieve_graph_batch(
+        self,
+        entity_lists: List[List[str]],
+        generation: int
+    ) -> List[Tuple[str, List[GraphPath], bool]]:
+        """
+        Retrieve graph context for several entity lists with one neighbor query.
+        
+        Neighbors of the union of all uncached entities are fetched at once
+        and split back per list using the entities each row was reached from.
+        
+        Args:
+            entity_lists: Entity names per query
+            generation: Value of self._generation when the retrieval started
+            
+        Returns:
+            Tuple of (formatted graph context, paths between entities, whether
+            both lookups succeeded) per list
+        """
+        cache_keys = [self._graph_cache_key(entities) for entities in entity_lists]
+        
+        found: Dict[Tuple[str, ...], Tuple[str, List[GraphPath], bool]] = {(): ("", [], True)}
+        missing: Dict[Tuple[str, ...], List[str]] = {}
+        for cache_key, entities in zip(cache_keys, entity_lists, strict=True):
+            if cache_key in found or cache_key in missing:
+                continue
+            cached = self._get_cached_graph(cache_key)
+            if cached is not None:
+                found[cache_key] = cached
+            else:
+                missing[cache_key] = entities
+        
+        if missing:
+            path_futures = {
+                cache_key: self._executor.submit(self._query_paths_between_entities, entities)
+                for cache_key, entities in missing.items()
+            }
+            neighbors = self._query_graph_neighbors(
+                _dedupe_entities(itertools.chain.from_iterable(missing.values()))
+            )
             
-            # Step 4: Find paths between entities
-            paths = self._get_paths_between_entities(entities)
-            result.graph_paths = paths
+            # The neighbor query has settled whether the index is used, so
+            # rows can be split by the lookup terms it was given
+            indexed = bool(self._fulltext_index_ready)
+            for cache_key, entities in missing.items():
+                terms = {term.lower() for term in _lookup_terms(entities, indexed)}
+                own_neighbors = None if neighbors is None else [
+                    row for row in neighbors
+                    if any(e.lower() in terms for e in row.entities)
+                ]
+                found[cache_key] = self._cache_graph(
+                    cache_key, own_neighbors, path_futures[cache_key].result(), generation
+                )
+        
+        return [
+            (context, list(paths), complete)
+            for context, paths, complete in (found[key] for key in cache_keys)
+        ]
+    
+    @staticmethod
+    def _collect_chunks(vector_docs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Extract non-empty document texts from vector results.
+        
+        Args:
+            vector_docs: Results from vector retrieval
             
-            # Step 5: Format graph context
-            result.graph_context = self._format_graph_context(all_neighbors, paths)
+        Returns:
+            List of document chunks
+        """
+        return [chunk for doc in vector_docs if (chunk := doc.get("document"))]
+    
+    def invalidate(self) -> None:
+        """
+        Drop all cached retrieval results and graph context.
         
-        return result
+        Called automatically when data is written through the retriever's
+        graph or vector manager; call it yourself after modifying the stores
+        by other means. Extracted entities and query embeddings are kept, as
+        they do not depend on stored data. Retrievals already in flight still
+        return their results but do not cache them.
+        """
+        with self._generation_lock:
+            self._generation += 1
+            self._result_cache.clear()
+            self._graph_cache.clear()
+            if self._semantic_indexes is not None:
+                for index in self._semantic_indexes.values():
+                    index.clear()
+    
+    def _is_graph_healthy(self) -> bool:
+        """
+        Check graph availability, reusing recent results.
+        
+        The outcome of a health check is reused for HEALTH_CHECK_TTL_SECONDS
+        so bursts of queries do not each ping Neo4j.
+        
+        Returns:
+            True if the graph database is reachable
+        """
+        now = time.monotonic()
+        if self._graph_health is not None:
+            checked_at, healthy = self._graph_health
+            if now - checked_at < HEALTH_CHECK_TTL_SECONDS:
+                return healthy
+        
+        try:
+            healthy = bool(self._graph.is_healthy())
+        except Exception:
+            logger.warning("Graph health check failed")
+            healthy = False
+        
+        self._graph_health = (now, healthy)
+        return healthy
     
     def retrieve_with_fallback(
         self,
@@ -398,19 +1850,22 @@ class HybridRetriever:
         """
         Retrieve with graceful fallback if graph database is unavailable.
         
+        Entities are extracted first; if there are none the graph is not
+        needed and its health check is skipped entirely.
+        
         Args:
             query: User's question
             
         Returns:
             RetrievalResult (vector-only if graph fails)
         """
+        # Extraction results are memoized, so retrieve() below reuses them
+        if not self._extract_entities(query):
+            return self.retrieve(query, include_graph=False)
+        
         # Check if graph is available
-        try:
-            if not self._graph.is_healthy():
-                logger.warning("Graph database unavailable, using vector-only retrieval")
-                return self.retrieve(query, include_graph=False)
-        except Exception:
-            logger.warning("Graph health check failed, using vector-only retrieval")
+        if not self._is_graph_healthy():
+            logger.warning("Graph database unavailable, using vector-only retrieval")
             return self.retrieve(query, include_graph=False)
         
         return self.retrieve(query, include_graph=True)
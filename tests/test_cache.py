@@ -0,0 +1,187 @@
+"""
+Tests for the retrieval query cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.retriever.cache import QueryCache, SemanticIndex
+
+
+class TestQueryCacheKeys:
+    """Tests for cache key construction."""
+
+    def test_should_normalize_query_text(self) -> None:
+        """Should map case and whitespace variants to the same key."""
+        assert QueryCache.make_key("  Singapore Strike? ") == QueryCache.make_key("singapore strike?")
+
+    def test_should_distinguish_different_queries(self) -> None:
+        """Should map different queries to different keys."""
+        assert QueryCache.make_key("Singapore") != QueryCache.make_key("GlobalTech")
+
+
+class TestQueryCacheLookup:
+    """Tests for get/put behaviour."""
+
+    def test_should_return_stored_value(self) -> None:
+        """Should return a value after it has been stored."""
+        cache = QueryCache(max_size=2)
+        cache.put("a", 1)
+        
+        assert cache.get("a") == 1
+        assert cache.hits == 1
+
+    def test_should_count_misses(self) -> None:
+        """Should return None and count a miss for unknown keys."""
+        cache = QueryCache(max_size=2)
+        
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_should_evict_least_recently_used(self) -> None:
+        """Should evict the least recently used entry when full."""
+        cache = QueryCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_should_expire_entries_after_ttl(self) -> None:
+        """Should treat entries older than the TTL as missing."""
+        with patch("src.retriever.cache.time.monotonic") as mock_clock:
+            mock_clock.return_value = 100.0
+            cache = QueryCache(max_size=2, ttl=10)
+            cache.put("a", 1)
+            
+            mock_clock.return_value = 105.0
+            assert cache.get("a") == 1
+            
+            mock_clock.return_value = 111.0
+            assert cache.get("a") is None
+            assert len(cache) == 0
+
+    def test_should_clear_all_entries(self) -> None:
+        """Should remove every entry on clear."""
+        cache = QueryCache(max_size=2)
+        cache.put("a", 1)
+        cache.clear()
+        
+        assert cache.get("a") is None
+
+    def test_should_reject_non_positive_size(self) -> None:
+        """Should not allow a cache that cannot hold anything."""
+        with pytest.raises(ValueError):
+            QueryCache(max_size=0)
+
+
+class TestQueryCachePersistence:
+    """Tests for saving and loading cache contents."""
+
+    def test_should_restore_saved_entries(self, tmp_path) -> None:
+        """Should restore entries and LRU order in a new cache."""
+        path = tmp_path / "cache.db"
+        cache = QueryCache(max_size=3, ttl=60)
+        cache.put("a", 1)
+        cache.put(("b", "c"), [2])
+        
+        assert cache.save(path) == 2
+        
+        restored = QueryCache(max_size=3, ttl=60)
+        assert restored.load(path) == 2
+        assert restored.get(("b", "c")) == [2]
+        
+        restored.put("d", 4)
+        restored.put("e", 5)
+        assert restored.get("a") is None
+
+    def test_should_keep_most_recent_entries_that_fit(self, tmp_path) -> None:
+        """Should keep only the most recently used entries that fit."""
+        path = tmp_path / "cache.db"
+        cache = QueryCache(max_size=3)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+        cache.save(path)
+        
+        restored = QueryCache(max_size=2)
+        
+        assert restored.load(path) == 2
+        assert restored.get("a") is None
+        assert restored.get("c") == "c"
+
+    def test_should_skip_entries_expired_since_saving(self, tmp_path) -> None:
+        """Should not restore entries whose TTL ran out after saving."""
+        path = tmp_path / "cache.db"
+        cache = QueryCache(max_size=2, ttl=10)
+        cache.put("a", 1)
+        cache.save(path)
+        
+        restored = QueryCache(max_size=2, ttl=10)
+        with patch("src.retriever.cache.time.time", return_value=float("inf")):
+            assert restored.load(path) == 0
+
+    def test_should_keep_caches_separate_by_name(self, tmp_path) -> None:
+        """Should store differently named caches side by side."""
+        path = tmp_path / "cache.db"
+        first, second = QueryCache(), QueryCache()
+        first.put("a", 1)
+        second.put("a", 2)
+        first.save(path, name="first")
+        second.save(path, name="second")
+        
+        restored = QueryCache()
+        restored.load(path, name="second")
+        
+        assert restored.get("a") == 2
+
+    def test_should_ignore_missing_file(self, tmp_path) -> None:
+        """Should leave the cache empty when nothing was saved."""
+        cache = QueryCache()
+        
+        assert cache.load(tmp_path / "missing.db") == 0
+        assert len(cache) == 0
+
+
+class TestSemanticIndex:
+    """Tests for embedding-similarity lookups."""
+
+    def test_should_match_similar_embedding(self) -> None:
+        """Should return the key of an embedding above the threshold."""
+        index = SemanticIndex(threshold=0.95)
+        index.add("strike", [1.0, 0.0, 0.0])
+        index.add("flood", [0.0, 1.0, 0.0])
+        
+        assert index.lookup([0.99, 0.05, 0.0]) == "strike"
+
+    def test_should_not_match_below_threshold(self) -> None:
+        """Should return None when no embedding is similar enough."""
+        index = SemanticIndex(threshold=0.95)
+        index.add("strike", [1.0, 0.0, 0.0])
+        
+        assert index.lookup([0.7, 0.7, 0.0]) is None
+
+    def test_should_overwrite_oldest_embedding_when_full(self) -> None:
+        """Should keep at most max_size embeddings."""
+        index = SemanticIndex(threshold=0.95, max_size=2)
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+        index.add("c", [-1.0, 0.0])
+        
+        assert len(index) == 2
+        assert index.lookup([1.0, 0.0]) is None
+        assert index.lookup([-1.0, 0.0]) == "c"
+
+    def test_should_ignore_zero_and_mismatched_embeddings(self) -> None:
+        """Should not index zero vectors or match vectors of another size."""
+        index = SemanticIndex(threshold=0.95)
+        index.add("zero", [0.0, 0.0])
+        
+        assert len(index) == 0
+        
+        index.add("a", [1.0, 0.0])
+        
+        assert index.lookup([1.0, 0.0, 0.0]) is None
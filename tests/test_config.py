@@ -91,6 +91,36 @@ class TestRetrievalConfig:
         config = RetrievalConfig()
         
         assert config.graph_max_hops == 2
+    
+    def test_cache_path_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should not persist caches unless a path is configured."""
+        monkeypatch.delenv("RETRIEVAL_CACHE_PATH", raising=False)
+        
+        assert RetrievalConfig().cache_path is None
+    
+    def test_cache_path_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should read the cache path from the environment."""
+        monkeypatch.setenv("RETRIEVAL_CACHE_PATH", "/tmp/atlas/cache.db")
+        
+        assert RetrievalConfig().cache_path == Path("/tmp/atlas/cache.db")
+    
+    def test_semantic_cache_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should not enable semantic caching unless a threshold is set."""
+        monkeypatch.delenv("RETRIEVAL_SEMANTIC_CACHE_THRESHOLD", raising=False)
+        
+        assert RetrievalConfig().semantic_cache_threshold is None
+    
+    def test_semantic_threshold_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should read the semantic cache threshold from the environment."""
+        monkeypatch.setenv("RETRIEVAL_SEMANTIC_CACHE_THRESHOLD", "0.9")
+        
+        assert RetrievalConfig().semantic_cache_threshold == 0.9
+    
+    def test_preload_models_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should not preload models unless enabled."""
+        monkeypatch.delenv("RETRIEVAL_PRELOAD_MODELS", raising=False)
+        
+        assert RetrievalConfig().preload_models is False
 
 
 class TestAppConfig:
@@ -116,6 +146,12 @@ class TestAppConfig:
         config = AppConfig()
         
         assert config.debug is False
+    
+    def test_debug_respects_environment_variable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should parse DEBUG from the environment."""
+        monkeypatch.setenv("DEBUG", "yes")
+        
+        assert AppConfig().debug is True
 
 
 class TestGetConfig:
@@ -126,3 +162,18 @@ class TestGetConfig:
         config = get_config()
         
         assert isinstance(config, AppConfig)
+    
+    def test_returns_cached_instance(self) -> None:
+        """Should return the same instance on repeated calls."""
+        assert get_config() is get_config()
+    
+    def test_cache_clear_rereads_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should pick up environment changes after the cache is cleared."""
+        monkeypatch.setenv("LOG_LEVEL", "WARNING")
+        get_config.cache_clear()
+        
+        try:
+            assert get_config().log_level == "WARNING"
+        finally:
+            monkeypatch.undo()
+            get_config.cache_clear()
@@ -91,6 +91,34 @@ class TestGraphDatabaseManagerConnection:
             mock_driver.close.assert_called_once()
 
 
+class TestGraphDatabaseManagerSchema:
+    """Tests for schema setup."""
+
+    def test_should_create_fulltext_index_idempotently(self) -> None:
+        """Should create the entity name full-text index with IF NOT EXISTS."""
+        with patch("src.database.graph_db.GraphDatabase") as mock_db:
+            mock_driver = MagicMock()
+            mock_session = MagicMock()
+            
+            mock_db.driver.return_value = mock_driver
+            mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
+            mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+            
+            manager = GraphDatabaseManager(
+                uri="bolt://localhost:7687",
+                username="neo4j",
+                password="password"
+            )
+            
+            manager.ensure_fulltext_index()
+            
+            create, wait = mock_session.run.call_args_list
+            assert "CREATE FULLTEXT INDEX entity_name_idx IF NOT EXISTS" in create.args[0]
+            assert "FOR (n:Entity) ON EACH [n.name]" in create.args[0]
+            assert wait.args[0] == "CALL db.awaitIndex($index, $timeout)"
+            assert wait.args[1]["index"] == "entity_name_idx"
+
+
 class TestGraphDatabaseManagerQueries:
     """Tests for query execution."""
 
@@ -178,6 +206,7 @@ class TestGraphDatabaseManagerMerge:
             call_args = mock_session.run.call_args[0][0]
             assert "MERGE" in call_args
             assert "Company" in call_args
+            assert "SET n:Entity" in call_args
 
     def test_should_merge_relationship(self) -> None:
         """Should create relationship using MERGE for idempotency."""
@@ -208,6 +237,36 @@ class TestGraphDatabaseManagerMerge:
             call_args = mock_session.run.call_args[0][0]
             assert "MERGE" in call_args
             assert "MANUFACTURES" in call_args
+            assert "SET a:Entity, b:Entity" in call_args
+
+    def test_should_notify_invalidation_listeners_after_merge(self) -> None:
+        """Should call registered listeners after every MERGE."""
+        with patch("src.database.graph_db.GraphDatabase") as mock_db:
+            mock_driver = MagicMock()
+            mock_session = MagicMock()
+            
+            mock_db.driver.return_value = mock_driver
+            mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
+            mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+            
+            manager = GraphDatabaseManager(
+                uri="bolt://localhost:7687",
+                username="neo4j",
+                password="password"
+            )
+            listener = MagicMock()
+            manager.add_invalidation_listener(listener)
+            
+            manager.merge_node(label="Company", properties={"name": "TechFlow Inc."})
+            manager.merge_relationship(
+                from_label="Company",
+                from_props={"name": "TechFlow Inc."},
+                to_label="Location",
+                to_props={"name": "Singapore"},
+                rel_type="OPERATES_AT"
+            )
+            
+            assert listener.call_count == 2
 
 
 class TestGraphDatabaseManagerGraphTraversal:
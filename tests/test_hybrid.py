@@ -2,9 +2,21 @@
 Tests for the Hybrid Retriever.
 """
 
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langchain_core.messages import AIMessage
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Drop clients shared across retrievers so each test sees its patches."""
+    from src.retriever import hybrid
+    
+    hybrid._get_llm.cache_clear()
+    monkeypatch.setattr(hybrid, "_shared_graph", None)
 
 
 class TestHybridRetrieverInitialization:
@@ -12,8 +24,8 @@ class TestHybridRetrieverInitialization:
 
     def test_should_create_with_default_config(self) -> None:
         """Should create retriever with default configuration."""
-        with patch("src.retriever.hybrid.GraphDatabaseManager") as mock_graph:
-            with patch("src.retriever.hybrid.VectorDatabaseManager") as mock_vector:
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
                 mock_graph_instance = MagicMock()
                 mock_graph.return_value = mock_graph_instance
                 
@@ -26,15 +38,98 @@ class TestHybridRetrieverInitialization:
                 
                 assert retriever is not None
 
+    def test_should_share_llm_client_between_instances(self) -> None:
+        """Should reuse one LLM client per model and base URL."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    first = HybridRetriever()
+                    second = HybridRetriever()
+                    
+                    assert first._llm is second._llm
+                    assert mock_llm_class.call_count == 1
+
+    def test_should_share_graph_manager_between_instances(self) -> None:
+        """Should reuse one graph manager unless one is injected."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                from src.retriever.hybrid import HybridRetriever
+                
+                injected = MagicMock()
+                first = HybridRetriever()
+                second = HybridRetriever()
+                third = HybridRetriever(graph_manager=injected)
+                
+                assert first._graph is second._graph
+                assert third._graph is injected
+                assert mock_graph.call_count == 1
+
+    def test_should_shut_down_workers_on_close(self) -> None:
+        """Should release the worker pool when used as a context manager."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                from src.retriever.hybrid import HybridRetriever
+                
+                with HybridRetriever() as retriever:
+                    pass
+                
+                with pytest.raises(RuntimeError):
+                    retriever._executor.submit(lambda: None)
+
+    def test_should_preload_models_when_enabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should invoke the LLM and embedding model once at start-up."""
+        from src.config import get_config
+        
+        monkeypatch.setenv("RETRIEVAL_PRELOAD_MODELS", "true")
+        get_config.cache_clear()
+        try:
+            with patch("src.database.graph_db.GraphDatabaseManager"):
+                with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                    with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                        mock_vector_instance = MagicMock()
+                        mock_vector.return_value = mock_vector_instance
+                        mock_llm = MagicMock()
+                        mock_llm_class.return_value = mock_llm
+                        
+                        from src.retriever.hybrid import HybridRetriever
+                        
+                        with HybridRetriever():
+                            pass
+                        
+                        assert mock_llm.invoke.call_count == 1
+                        mock_vector_instance.embed.assert_called_once_with("warmup")
+        finally:
+            get_config.cache_clear()
+
+    def test_should_not_preload_models_by_default(self) -> None:
+        """Should leave model loading to the first query by default."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_vector_instance = MagicMock()
+                    mock_vector.return_value = mock_vector_instance
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    with HybridRetriever():
+                        pass
+                    
+                    mock_llm.invoke.assert_not_called()
+                    mock_vector_instance.embed.assert_not_called()
+
 
 class TestEntityExtraction:
     """Tests for entity extraction from queries."""
 
     def test_should_extract_entities_from_query(self) -> None:
         """Should identify entity names in query text."""
-        with patch("src.retriever.hybrid.GraphDatabaseManager") as mock_graph:
-            with patch("src.retriever.hybrid.VectorDatabaseManager") as mock_vector:
-                with patch("src.retriever.hybrid.OllamaLLM") as mock_llm_class:
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
                     mock_graph_instance = MagicMock()
                     mock_graph.return_value = mock_graph_instance
                     
@@ -43,7 +138,7 @@ class TestEntityExtraction:
                     
                     mock_llm = MagicMock()
                     mock_llm_class.return_value = mock_llm
-                    mock_llm.invoke.return_value = '["Singapore", "GlobalTech"]'
+                    mock_llm.invoke.return_value = AIMessage(content='["Singapore", "GlobalTech"]')
                     
                     from src.retriever.hybrid import HybridRetriever
                     
@@ -54,14 +149,197 @@ class TestEntityExtraction:
                     
                     assert "Singapore" in entities or "globaltech" in entities.lower() if isinstance(entities, str) else any("singapore" in e.lower() or "globaltech" in e.lower() for e in entities)
 
+    def test_should_ignore_trailing_commentary(self) -> None:
+        """Should parse the first JSON array even if the LLM adds more text."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(
+                        content='["Singapore", "GlobalTech"]\n\nNote: see [1] for details.'
+                    )
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    entities = retriever._extract_entities(
+                        "How will the strike in Singapore impact GlobalTech?"
+                    )
+                    
+                    assert entities == ["Singapore", "GlobalTech"]
+
+    def test_should_parse_multiline_array(self) -> None:
+        """Should parse a JSON array spread over several lines."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(
+                        content='Answer:\n[\n  "Singapore",\n  "GlobalTech"\n]'
+                    )
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    entities = retriever._extract_entities("Singapore and GlobalTech?")
+                    
+                    assert entities == ["Singapore", "GlobalTech"]
+
+    def test_should_dedupe_entities_case_insensitively(self) -> None:
+        """Should drop case variants and blanks, keeping the first spelling."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(
+                        content='["Singapore", "singapore ", "", "GlobalTech", "SINGAPORE"]'
+                    )
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    entities = retriever._extract_entities("Singapore and GlobalTech?")
+                    
+                    assert entities == ["Singapore", "GlobalTech"]
+
+    def test_should_cache_entities_for_repeated_query(self) -> None:
+        """Should only invoke the LLM once for the same normalized query."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='["Singapore"]')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    first = retriever._extract_entities("Singapore strike impact?")
+                    second = retriever._extract_entities("  singapore strike impact?  ")
+                    
+                    assert first == second == ["Singapore"]
+                    assert mock_llm.invoke.call_count == 1
+
+    def test_should_not_cache_failed_extraction(self) -> None:
+        """Should retry the LLM when a previous extraction failed."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.side_effect = [
+                        ConnectionError("down"),
+                        AIMessage(content='["Singapore"]'),
+                    ]
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    
+                    assert retriever._extract_entities("Singapore strike?") == []
+                    assert retriever._extract_entities("Singapore strike?") == ["Singapore"]
+
+    def test_should_extract_entities_for_several_queries_in_one_call(self) -> None:
+        """Should send one numbered prompt and map the answers back by position."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(
+                        content='Sure: {"1": ["Singapore"], "2": ["TechFlow", "techflow"]}'
+                    )
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    entities = retriever._extract_entities_batch(
+                        ["Singapore strike?", "TechFlow suppliers?", "singapore strike?"]
+                    )
+                    
+                    assert entities == [["Singapore"], ["TechFlow"], ["Singapore"]]
+                    assert mock_llm.invoke.call_count == 1
+                    prompt = mock_llm.invoke.call_args.args[0][-1].content
+                    assert '1. "Singapore strike?"' in prompt
+                    assert '2. "TechFlow suppliers?"' in prompt
+                    
+                    # Now cached per query
+                    assert retriever._extract_entities("TechFlow suppliers?") == ["TechFlow"]
+                    assert mock_llm.invoke.call_count == 1
+    
+    def test_should_fall_back_to_single_extraction_for_unparsed_queries(self) -> None:
+        """Should extract queries missing from the batched answer one by one."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.side_effect = [
+                        AIMessage(content='{"1": ["Singapore"]}'),
+                        AIMessage(content='["TechFlow"]'),
+                    ]
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    entities = retriever._extract_entities_batch(
+                        ["Singapore strike?", "TechFlow suppliers?"]
+                    )
+                    
+                    assert entities == [["Singapore"], ["TechFlow"]]
+                    assert mock_llm.invoke.call_count == 2
+
+    def test_should_share_system_prompt_across_retrievers(self) -> None:
+        """Should send the same system message first on every extraction."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='["Singapore"]')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    first = HybridRetriever()
+                    second = HybridRetriever()
+                    first._extract_entities("Singapore strike?")
+                    second._extract_entities("Port delays?")
+                    
+                    prompts = [c.args[0] for c in mock_llm.invoke.call_args_list]
+                    assert prompts[0][0] is prompts[1][0]
+                    assert "Singapore strike?" not in prompts[0][0].content
+
+    def test_should_parse_entities_from_content_blocks(self) -> None:
+        """Should read entities from list-shaped message content."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content=[
+                        {"type": "text", "text": '["Singapore",'},
+                        ' "GlobalTech"]',
+                    ])
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    
+                    assert retriever._extract_entities("Singapore strike?") == [
+                        "Singapore", "GlobalTech"
+                    ]
+
 
 class TestVectorRetrieval:
     """Tests for vector-based retrieval."""
 
     def test_should_retrieve_similar_documents(self) -> None:
         """Should retrieve semantically similar documents."""
-        with patch("src.retriever.hybrid.GraphDatabaseManager") as mock_graph:
-            with patch("src.retriever.hybrid.VectorDatabaseManager") as mock_vector:
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
                 mock_graph_instance = MagicMock()
                 mock_graph.return_value = mock_graph_instance
                 
@@ -75,18 +353,58 @@ class TestVectorRetrieval:
                 from src.retriever.hybrid import HybridRetriever
                 
                 retriever = HybridRetriever()
-                docs = retriever._retrieve_vector("Singapore strike impact")
+                docs = retriever._query_vector("Singapore strike impact")
                 
                 assert len(docs) == 2
 
+    def test_should_reuse_cached_query_embedding(self) -> None:
+        """Should embed each distinct query once and pass the vector to the store."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                mock_vector_instance = MagicMock()
+                mock_vector.return_value = mock_vector_instance
+                mock_vector_instance.embed.return_value = [0.1, 0.2]
+                mock_vector_instance.query_similar.return_value = []
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                retriever._query_vector("Singapore strike impact")
+                retriever.invalidate()
+                retriever._query_vector("  singapore STRIKE impact ")
+                
+                assert mock_vector_instance.embed.call_count == 1
+                kwargs = mock_vector_instance.query_similar.call_args.kwargs
+                assert kwargs["query_embedding"] == [0.1, 0.2]
+    
+    def test_should_fall_back_to_query_text_when_embedding_fails(self) -> None:
+        """Should let the store embed the text when embedding fails."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                mock_vector_instance = MagicMock()
+                mock_vector.return_value = mock_vector_instance
+                mock_vector_instance.embed.side_effect = ConnectionError("down")
+                mock_vector_instance.query_similar.return_value = [
+                    {"id": "doc1", "document": "Singapore port strike", "distance": 0.1}
+                ]
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                docs = retriever._query_vector("Singapore strike impact")
+                
+                assert len(docs) == 1
+                kwargs = mock_vector_instance.query_similar.call_args.kwargs
+                assert kwargs["query_embedding"] is None
+
 
 class TestGraphRetrieval:
     """Tests for graph-based retrieval."""
 
     def test_should_find_n_hop_neighbors(self) -> None:
         """Should find entities within N hops."""
-        with patch("src.retriever.hybrid.GraphDatabaseManager") as mock_graph:
-            with patch("src.retriever.hybrid.VectorDatabaseManager") as mock_vector:
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
                 mock_graph_instance = MagicMock()
                 mock_graph.return_value = mock_graph_instance
                 # Mock execute_query which is used internally
@@ -101,14 +419,32 @@ class TestGraphRetrieval:
                 from src.retriever.hybrid import HybridRetriever
                 
                 retriever = HybridRetriever()
-                neighbors = retriever._retrieve_graph_neighbors("Singapore")
+                neighbors = retriever._query_graph_neighbors("Singapore")
                 
                 assert len(neighbors) >= 1
+                assert neighbors[0].source == "Singapore"
+                assert neighbors[1].relationships == ("AFFECTS", "DEPENDS_ON")
+
+    def test_should_share_repeated_names_across_edges(self) -> None:
+        """Should intern node names so repeated names are one object."""
+        from src.retriever.hybrid import GraphEdge
+        
+        first = GraphEdge.from_record(
+            {"source": "".join(["Singa", "pore"]), "target": "FlowChips",
+             "relationships": ["OPERATES_AT"], "path_length": 1}
+        )
+        second = GraphEdge.from_record(
+            {"source": "".join(["Sing", "apore"]), "target": "GlobalTech",
+             "relationships": ["OPERATES_AT"], "path_length": 1}
+        )
+        
+        assert first.source is second.source
+        assert first.relationships[0] is second.relationships[0]
 
     def test_should_generate_cypher_query(self) -> None:
         """Should generate appropriate Cypher query for entities."""
-        with patch("src.retriever.hybrid.GraphDatabaseManager") as mock_graph:
-            with patch("src.retriever.hybrid.VectorDatabaseManager") as mock_vector:
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
                 mock_graph_instance = MagicMock()
                 mock_graph.return_value = mock_graph_instance
                 
@@ -118,10 +454,198 @@ class TestGraphRetrieval:
                 from src.retriever.hybrid import HybridRetriever
                 
                 retriever = HybridRetriever()
-                query = retriever._build_neighbor_query("Singapore", max_hops=2)
+                query, params = retriever._build_neighbor_query("Singapore", max_hops=2)
                 
                 assert "MATCH" in query
-                assert "Singapore" in query
+                assert "UNWIND $entities" in query
+                assert "db.index.fulltext.queryNodes" in query
+                assert "Singapore" not in query
+                assert params["entities"] == ['"Singapore"']
+    
+    def test_should_limit_neighbors_per_entity(self) -> None:
+        """Should apply the neighbor limit to each entity, not the whole batch."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                from src.retriever.hybrid import NEIGHBOR_LIMIT_PER_ENTITY, HybridRetriever
+                
+                retriever = HybridRetriever()
+                query, params = retriever._build_neighbor_query(
+                    ["Singapore", "GlobalTech"], max_hops=2
+                )
+                
+                subquery = query[query.index("CALL {"):query.index("}")]
+                assert "LIMIT $per_entity" in subquery
+                assert "LIMIT" not in query[query.index("}"):]
+                assert params["per_entity"] == NEIGHBOR_LIMIT_PER_ENTITY
+
+    def test_should_reuse_query_text_per_hop_count(self) -> None:
+        """Should share the neighbor query text per hop count across retrievers."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                other = HybridRetriever()
+                first, first_params = retriever._build_neighbor_query("Singapore", max_hops=2)
+                second, second_params = other._build_neighbor_query("GlobalTech", max_hops=2)
+                third, _ = retriever._build_neighbor_query("GlobalTech", max_hops=3)
+                
+                assert first is second
+                assert first_params["entities"] != second_params["entities"]
+                assert "*1..3" in third
+
+    def test_should_use_precomputed_query_text(self) -> None:
+        """Should take common hop counts from the import-time table."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                from src.retriever import hybrid
+                
+                retriever = hybrid.HybridRetriever()
+                common, _ = retriever._build_neighbor_query("Singapore", max_hops=3)
+                rare, _ = retriever._build_neighbor_query("Singapore", max_hops=8)
+                
+                assert common is hybrid._NEIGHBOR_QUERIES[(3, True)]
+                assert "*1..8" in rare
+                assert retriever._build_neighbor_query("GlobalTech", max_hops=8)[0] is rare
+
+    def test_should_ensure_fulltext_index_once(self) -> None:
+        """Should create the entity name index before the first graph lookup only."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                mock_graph_instance = MagicMock()
+                mock_graph.return_value = mock_graph_instance
+                mock_graph_instance.execute_query.return_value = []
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                retriever._query_graph_neighbors("Singapore")
+                retriever._query_graph_neighbors("GlobalTech")
+                
+                mock_graph_instance.ensure_fulltext_index.assert_called_once()
+
+    def test_should_not_retry_failed_fulltext_index(self) -> None:
+        """Should attempt index creation once and scan names when it fails."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                mock_graph_instance = MagicMock()
+                mock_graph.return_value = mock_graph_instance
+                mock_graph_instance.execute_query.return_value = []
+                mock_graph_instance.ensure_fulltext_index.side_effect = Exception("denied")
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                retriever._query_graph_neighbors("Singapore")
+                retriever._query_graph_neighbors("GlobalTech")
+                
+                mock_graph_instance.ensure_fulltext_index.assert_called_once()
+                query, params = mock_graph_instance.execute_query.call_args.args
+                assert "db.index.fulltext.queryNodes" not in query
+                assert "toLower(n.name) CONTAINS toLower(entity)" in query
+                assert params["entities"] == ["GlobalTech"]
+
+    def test_should_scan_path_endpoints_without_fulltext_index(self) -> None:
+        """Should fall back to name scans for path searches too."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                mock_graph_instance = MagicMock()
+                mock_graph.return_value = mock_graph_instance
+                mock_graph_instance.execute_query.return_value = []
+                mock_graph_instance.ensure_fulltext_index.side_effect = Exception("denied")
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                retriever._query_paths_between_entities(["Singapore", "GlobalTech"])
+                
+                query, params = mock_graph_instance.execute_query.call_args.args
+                assert "toLower(a.name) CONTAINS toLower(pair[0])" in query
+                assert params["pairs"] == [["Singapore", "GlobalTech"]]
+
+    def test_should_wait_for_fulltext_index_before_concurrent_lookups(self) -> None:
+        """Should not query the graph until index creation has finished."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                mock_graph_instance = MagicMock()
+                mock_graph.return_value = mock_graph_instance
+                index_online = threading.Event()
+                queried_before_online = []
+                
+                def create_index() -> None:
+                    time.sleep(0.05)
+                    index_online.set()
+                
+                def execute_query(query: str, params: dict) -> list:
+                    queried_before_online.append(not index_online.is_set())
+                    return []
+                
+                mock_graph_instance.ensure_fulltext_index.side_effect = create_index
+                mock_graph_instance.execute_query.side_effect = execute_query
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                retriever._retrieve_graph_for_entities(["Singapore", "GlobalTech"], 0)
+                
+                mock_graph_instance.ensure_fulltext_index.assert_called_once()
+                assert queried_before_online == [False, False]
+
+    def test_should_quote_entities_as_fulltext_phrases(self) -> None:
+        """Should escape Lucene phrase metacharacters in entity names."""
+        from src.retriever.hybrid import _fulltext_phrase
+        
+        assert _fulltext_phrase("GlobalTech") == '"GlobalTech"'
+        assert _fulltext_phrase('The "Big" Port') == '"The \\"Big\\" Port"'
+
+    def test_should_search_paths_between_all_entity_pairs(self) -> None:
+        """Should look up paths for every entity pair in a single query."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                mock_graph_instance = MagicMock()
+                mock_graph.return_value = mock_graph_instance
+                mock_graph_instance.execute_query.return_value = [
+                    {"nodes": ["Singapore", "FlowChips", "GlobalTech"],
+                     "relationships": ["OPERATES_AT", "SUPPLIES"], "path_length": 2}
+                ]
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                paths = retriever._query_paths_between_entities(
+                    ["Singapore", "GlobalTech", "FlowChips"]
+                )
+                
+                assert mock_graph_instance.execute_query.call_count == 1
+                query, params = mock_graph_instance.execute_query.call_args.args
+                assert "allShortestPaths" in query
+                assert params["pairs"] == [
+                    ['"Singapore"', '"GlobalTech"'],
+                    ['"Singapore"', '"FlowChips"'],
+                    ['"GlobalTech"', '"FlowChips"'],
+                ]
+                assert paths[0].nodes == ["Singapore", "FlowChips", "GlobalTech"]
+
+    def test_should_format_graph_context(self) -> None:
+        """Should render each neighbor pair with its relationships."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                from src.retriever.hybrid import GraphEdge, GraphPath, HybridRetriever
+                
+                retriever = HybridRetriever()
+                context = retriever._format_graph_context(
+                    [
+                        GraphEdge("Singapore", "FlowChips", ("OPERATES_AT",), 1),
+                        GraphEdge("Singapore", "GlobalTech", (), 2),
+                    ],
+                    [GraphPath(nodes=["A", "B"], relationships=["DEPENDS_ON"], path_length=1)],
+                )
+                
+                assert context.splitlines() == [
+                    "- Singapore --[OPERATES_AT]--> FlowChips",
+                    "- Singapore --[RELATED]--> GlobalTech",
+                    "- Path: A -[DEPENDS_ON]-> B",
+                ]
 
 
 class TestHybridSearch:
@@ -129,9 +653,9 @@ class TestHybridSearch:
 
     def test_should_combine_vector_and_graph_results(self) -> None:
         """Should merge results from both retrieval methods."""
-        with patch("src.retriever.hybrid.GraphDatabaseManager") as mock_graph:
-            with patch("src.retriever.hybrid.VectorDatabaseManager") as mock_vector:
-                with patch("src.retriever.hybrid.OllamaLLM") as mock_llm_class:
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
                     mock_graph_instance = MagicMock()
                     mock_graph.return_value = mock_graph_instance
                     mock_graph_instance.find_neighbors.return_value = [
@@ -149,7 +673,7 @@ class TestHybridSearch:
                     
                     mock_llm = MagicMock()
                     mock_llm_class.return_value = mock_llm
-                    mock_llm.invoke.return_value = '["Singapore"]'
+                    mock_llm.invoke.return_value = AIMessage(content='["Singapore"]')
                     
                     from src.retriever.hybrid import HybridRetriever
                     
@@ -162,9 +686,9 @@ class TestHybridSearch:
 
     def test_should_handle_no_entities_found(self) -> None:
         """Should fallback to vector-only when no entities extracted."""
-        with patch("src.retriever.hybrid.GraphDatabaseManager") as mock_graph:
-            with patch("src.retriever.hybrid.VectorDatabaseManager") as mock_vector:
-                with patch("src.retriever.hybrid.OllamaLLM") as mock_llm_class:
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
                     mock_graph_instance = MagicMock()
                     mock_graph.return_value = mock_graph_instance
                     
@@ -176,7 +700,7 @@ class TestHybridSearch:
                     
                     mock_llm = MagicMock()
                     mock_llm_class.return_value = mock_llm
-                    mock_llm.invoke.return_value = '[]'
+                    mock_llm.invoke.return_value = AIMessage(content='[]')
                     
                     from src.retriever.hybrid import HybridRetriever
                     
@@ -185,6 +709,616 @@ class TestHybridSearch:
                     
                     # Should still return vector results
                     assert result.vector_chunks is not None
+                    
+                    # Should not run any graph query without entities
+                    assert mock_graph_instance.execute_query.call_count == 0
+                    assert result.graph_context == ""
+                    assert result.graph_paths == []
+
+    def test_should_query_neighbors_of_all_entities_at_once(self) -> None:
+        """Should issue one batched neighbor query regardless of entity count."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_graph_instance = MagicMock()
+                    mock_graph.return_value = mock_graph_instance
+                    mock_graph_instance.execute_query.return_value = []
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(
+                        content='["Singapore", "FlowChips", "GlobalTech"]'
+                    )
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    retriever.retrieve("How does Singapore affect FlowChips and GlobalTech?")
+                    
+                    neighbor_calls = [
+                        call for call in mock_graph_instance.execute_query.call_args_list
+                        if "UNWIND $entities" in call.args[0]
+                    ]
+                    assert len(neighbor_calls) == 1
+                    assert len(neighbor_calls[0].args[1]["entities"]) == 3
+
+    def test_should_share_graph_context_between_queries_with_same_entities(self) -> None:
+        """Should traverse the graph once for the same entity set."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_graph_instance = MagicMock()
+                    mock_graph.return_value = mock_graph_instance
+                    mock_graph_instance.execute_query.return_value = []
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.side_effect = [
+                        AIMessage(content='["Singapore", "GlobalTech"]'),
+                        AIMessage(content='["globaltech", "singapore"]'),
+                    ]
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    retriever.retrieve("Singapore strike impact on GlobalTech?")
+                    calls_after_first = mock_graph_instance.execute_query.call_count
+                    retriever.retrieve("What links GlobalTech to Singapore?")
+                    
+                    assert calls_after_first == 2
+                    assert mock_graph_instance.execute_query.call_count == calls_after_first
+
+    def test_should_not_cache_graph_context_after_errors(self) -> None:
+        """Should query the graph again when the previous lookup failed."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                mock_graph_instance = MagicMock()
+                mock_graph.return_value = mock_graph_instance
+                mock_graph_instance.execute_query.side_effect = Exception("Neo4j down")
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                context, paths, complete = retriever._retrieve_graph_for_entities(
+                    ["Singapore", "GlobalTech"], retriever._generation
+                )
+                
+                assert (context, paths, complete) == ("", [], False)
+                assert len(retriever._graph_cache) == 0
+                
+                mock_graph_instance.execute_query.side_effect = None
+                mock_graph_instance.execute_query.return_value = []
+                retriever._retrieve_graph_for_entities(
+                    ["Singapore", "GlobalTech"], retriever._generation
+                )
+                
+                assert mock_graph_instance.execute_query.call_count == 4
+                assert len(retriever._graph_cache) == 1
+
+    def test_should_cache_retrieval_results(self) -> None:
+        """Should serve repeated queries from the result cache until invalidated."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_graph_instance = MagicMock()
+                    mock_graph.return_value = mock_graph_instance
+                    mock_graph_instance.execute_query.return_value = []
+                    
+                    mock_vector_instance = MagicMock()
+                    mock_vector.return_value = mock_vector_instance
+                    mock_vector_instance.query_similar.return_value = [
+                        {"id": "doc1", "document": "Singapore strike", "distance": 0.1}
+                    ]
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='["Singapore"]')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    first = retriever.retrieve("Singapore strike impact?")
+                    second = retriever.retrieve("singapore strike impact?")
+                    
+                    assert second.vector_chunks == first.vector_chunks
+                    assert second.query == "singapore strike impact?"
+                    assert mock_vector_instance.query_similar.call_count == 1
+                    assert mock_llm.invoke.call_count == 1
+                    
+                    retriever.invalidate()
+                    retriever.retrieve("Singapore strike impact?")
+                    
+                    assert mock_vector_instance.query_similar.call_count == 2
+                    # Extracted entities do not depend on stored data
+                    assert mock_llm.invoke.call_count == 1
+
+    def test_should_batch_retrieve_with_one_graph_and_vector_call(self) -> None:
+        """Should dedupe queries and share graph and vector lookups across them."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_graph_instance = MagicMock()
+                    mock_graph.return_value = mock_graph_instance
+                    mock_graph_instance.execute_query.return_value = [
+                        {"source": "Singapore", "target": "FlowChips",
+                         "relationships": ["OPERATES_AT"], "path_length": 1,
+                         "entities": ['"Singapore"']},
+                        {"source": "TechFlow", "target": "GlobalTech",
+                         "relationships": ["SUPPLIES"], "path_length": 1,
+                         "entities": ['"TechFlow"']}
+                    ]
+                    
+                    mock_vector_instance = MagicMock()
+                    mock_vector.return_value = mock_vector_instance
+                    mock_vector_instance.embed.side_effect = ConnectionError("down")
+                    mock_vector_instance.query_similar_batch.return_value = [
+                        [{"id": "doc1", "document": "Singapore strike", "distance": 0.1}],
+                        [{"id": "doc2", "document": "TechFlow supplier", "distance": 0.2}]
+                    ]
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(
+                        content='{"1": ["Singapore"], "2": ["TechFlow"]}'
+                    )
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    results = retriever.batch_retrieve([
+                        "Singapore strike impact?",
+                        "Who does TechFlow supply?",
+                        "singapore strike impact?"
+                    ])
+                    
+                    assert [r.query for r in results] == [
+                        "Singapore strike impact?",
+                        "Who does TechFlow supply?",
+                        "singapore strike impact?"
+                    ]
+                    assert mock_llm.invoke.call_count == 1
+                    assert mock_graph_instance.execute_query.call_count == 1
+                    assert mock_vector_instance.query_similar_batch.call_count == 1
+                    
+                    assert "FlowChips" in results[0].graph_context
+                    assert "GlobalTech" not in results[0].graph_context
+                    assert "GlobalTech" in results[1].graph_context
+                    assert results[1].vector_chunks == ["TechFlow supplier"]
+                    assert results[2].graph_context == results[0].graph_context
+
+    def test_should_flush_caches_when_store_is_modified(self) -> None:
+        """Should re-run retrieval after data is written through a manager."""
+        with patch("src.database.graph_db.GraphDatabase"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                mock_vector_instance = MagicMock()
+                mock_vector.return_value = mock_vector_instance
+                mock_vector_instance.query_similar.return_value = []
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                retriever.retrieve("Singapore strike impact", include_graph=False)
+                retriever.retrieve("Singapore strike impact", include_graph=False)
+                
+                assert mock_vector_instance.query_similar.call_count == 1
+                
+                retriever._graph.merge_node(label="Company", properties={"name": "TechFlow"})
+                retriever.retrieve("Singapore strike impact", include_graph=False)
+                
+                assert mock_vector_instance.query_similar.call_count == 2
+
+    def test_should_not_cache_results_started_before_a_write(self) -> None:
+        """Should not keep results of a retrieval that overlapped a write."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_graph_instance = MagicMock()
+                    mock_graph.return_value = mock_graph_instance
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='["Singapore"]')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    
+                    def write_during_query(query, params):
+                        retriever.invalidate()
+                        return []
+                    
+                    mock_graph_instance.execute_query.side_effect = write_during_query
+                    retriever.retrieve("Singapore strike impact")
+                    
+                    assert len(retriever._result_cache) == 0
+                    assert len(retriever._graph_cache) == 0
+
+    def test_should_stop_listening_to_stores_on_close(self) -> None:
+        """Should unregister from the (shared) managers when closed."""
+        with patch("src.database.graph_db.GraphDatabase"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                from src.database.graph_db import GraphDatabaseManager
+                from src.retriever.hybrid import HybridRetriever
+                
+                graph = GraphDatabaseManager()
+                retriever = HybridRetriever(graph_manager=graph)
+                retriever.close()
+                
+                assert graph._invalidation_listeners == []
+                mock_vector.return_value.remove_invalidation_listener.assert_called_once_with(
+                    retriever.invalidate
+                )
+
+    @pytest.mark.asyncio
+    async def test_should_retrieve_asynchronously(self) -> None:
+        """Should await the LLM and share caches with retrieve()."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_graph_instance = MagicMock()
+                    mock_graph.return_value = mock_graph_instance
+                    mock_graph_instance.execute_query.return_value = [
+                        {"source": "Singapore", "target": "FlowChips",
+                         "relationships": ["OPERATES_AT"], "path_length": 1}
+                    ]
+                    
+                    mock_vector_instance = MagicMock()
+                    mock_vector.return_value = mock_vector_instance
+                    mock_vector_instance.query_similar.return_value = [
+                        {"id": "doc1", "document": "Singapore strike", "distance": 0.1}
+                    ]
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.ainvoke = AsyncMock(return_value=AIMessage(content='["Singapore"]'))
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    with HybridRetriever() as retriever:
+                        result = await retriever.aretrieve("Singapore strike impact")
+                        cached = retriever.retrieve("Singapore strike impact")
+                    
+                    assert result.entities == ["Singapore"]
+                    assert result.vector_chunks == ["Singapore strike"]
+                    assert "FlowChips" in result.graph_context
+                    assert cached == result
+                    mock_llm.ainvoke.assert_awaited_once()
+                    mock_llm.invoke.assert_not_called()
+
+    def test_should_not_cache_results_of_failed_lookups(self) -> None:
+        """Should retry retrieval when the vector search failed."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                mock_vector_instance = MagicMock()
+                mock_vector.return_value = mock_vector_instance
+                mock_vector_instance.query_similar.side_effect = [
+                    ConnectionError("down"),
+                    [{"id": "doc1", "document": "Singapore strike", "distance": 0.1}],
+                ]
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                failed = retriever.retrieve("Singapore strike impact", include_graph=False)
+                result = retriever.retrieve("Singapore strike impact", include_graph=False)
+                
+                assert failed.vector_chunks == []
+                assert result.vector_chunks == ["Singapore strike"]
+                assert mock_vector_instance.query_similar.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_not_cache_async_results_of_failed_extraction(self) -> None:
+        """Should retry asynchronous retrieval when entity extraction failed."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_vector_instance = MagicMock()
+                    mock_vector.return_value = mock_vector_instance
+                    mock_vector_instance.query_similar.return_value = []
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.ainvoke = AsyncMock(side_effect=[
+                        ConnectionError("down"),
+                        AIMessage(content='[]'),
+                    ])
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    with HybridRetriever() as retriever:
+                        await retriever.aretrieve("Singapore strike impact")
+                        await retriever.aretrieve("Singapore strike impact")
+                    
+                    assert mock_llm.ainvoke.await_count == 2
+                    assert mock_vector_instance.query_similar.call_count == 2
+
+    def test_should_not_cache_batch_results_of_failed_lookups(self) -> None:
+        """Should retry batched retrieval when the vector search failed."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_vector_instance = MagicMock()
+                    mock_vector.return_value = mock_vector_instance
+                    mock_vector_instance.query_similar_batch.side_effect = [
+                        ConnectionError("down"),
+                        [[], []],
+                    ]
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='{"1": [], "2": []}')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    queries = ["Singapore strike impact?", "Who does TechFlow supply?"]
+                    retriever.batch_retrieve(queries)
+                    retriever.batch_retrieve(queries)
+                    
+                    assert mock_vector_instance.query_similar_batch.call_count == 2
+                    assert len(retriever._result_cache) == 2
+
+
+class TestRetrieveWithFallback:
+    """Tests for retrieval with graph fallback."""
+
+    def test_should_skip_health_check_without_entities(self) -> None:
+        """Should not ping the graph when no entities were extracted."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_graph_instance = MagicMock()
+                    mock_graph.return_value = mock_graph_instance
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='[]')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    retriever.retrieve_with_fallback("What is supply chain management?")
+                    
+                    mock_graph_instance.is_healthy.assert_not_called()
+                    assert mock_llm.invoke.call_count == 1
+
+    def test_should_reuse_recent_health_check(self) -> None:
+        """Should only check graph health once within the TTL."""
+        with patch("src.database.graph_db.GraphDatabaseManager") as mock_graph:
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_graph_instance = MagicMock()
+                    mock_graph.return_value = mock_graph_instance
+                    mock_graph_instance.is_healthy.return_value = False
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='["Singapore"]')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    first = retriever.retrieve_with_fallback("Singapore strike impact?")
+                    retriever.retrieve_with_fallback("Singapore port delays?")
+                    
+                    assert mock_graph_instance.is_healthy.call_count == 1
+                    assert first.entities == []
+
+
+class TestCachePersistence:
+    """Tests for saving retrieval caches across processes."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        """Configure a cache file for the duration of a test."""
+        from src.config import get_config
+        
+        path = tmp_path / "cache.db"
+        monkeypatch.setenv("RETRIEVAL_CACHE_PATH", str(path))
+        get_config.cache_clear()
+        yield path
+        get_config.cache_clear()
+
+    def test_should_restore_entities_in_new_retriever(self, cache_path) -> None:
+        """Should reuse entities extracted by a closed retriever."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='["Singapore"]')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    with HybridRetriever() as retriever:
+                        retriever._extract_entities("Singapore strike?")
+                    
+                    assert cache_path.exists()
+                    
+                    with HybridRetriever() as retriever:
+                        assert retriever._extract_entities("Singapore strike?") == ["Singapore"]
+                    
+                    assert mock_llm.invoke.call_count == 1
+
+    def test_should_not_restore_entities_of_other_model(self, cache_path) -> None:
+        """Should namespace persisted entities by the extraction model."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='["Singapore"]')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    with HybridRetriever(model="llama3") as retriever:
+                        retriever._extract_entities("Singapore strike?")
+                    
+                    with HybridRetriever(model="mistral") as retriever:
+                        retriever._extract_entities("Singapore strike?")
+                    
+                    assert mock_llm.invoke.call_count == 2
+
+    def test_should_only_persist_model_outputs(self, cache_path) -> None:
+        """Should not persist results or graph context, which depend on stored data."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                names = set(retriever._persistent_caches())
+                retriever.close()
+                
+                assert all(name.startswith(("entities:", "embeddings:")) for name in names)
+                assert len(names) == 2
+
+    def test_should_unregister_exit_hook_on_close(self, cache_path) -> None:
+        """Should not keep an atexit hook for closed retrievers."""
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager"):
+                with patch("src.retriever.hybrid.atexit") as mock_atexit:
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    hook = mock_atexit.register.call_args.args[0]
+                    retriever.close()
+                    
+                    mock_atexit.unregister.assert_called_once_with(hook)
+
+
+class TestSemanticCache:
+    """Tests for reusing results of paraphrased queries."""
+
+    @pytest.fixture(autouse=True)
+    def semantic_threshold(self, monkeypatch: pytest.MonkeyPatch):
+        """Enable semantic caching for the duration of a test."""
+        from src.config import get_config
+        
+        monkeypatch.setenv("RETRIEVAL_SEMANTIC_CACHE_THRESHOLD", "0.95")
+        get_config.cache_clear()
+        yield
+        get_config.cache_clear()
+
+    def test_should_reuse_result_of_similar_query(self) -> None:
+        """Should answer a paraphrase from the cache and retrieve unrelated queries."""
+        embeddings = {
+            "Singapore strike impact": [1.0, 0.0],
+            "Impact of the Singapore strike": [0.99, 0.05],
+            "Flooding in Rotterdam": [0.0, 1.0],
+        }
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                mock_vector_instance = MagicMock()
+                mock_vector.return_value = mock_vector_instance
+                mock_vector_instance.embed.side_effect = embeddings.get
+                mock_vector_instance.query_similar.return_value = [
+                    {"id": "doc1", "document": "Singapore port strike", "distance": 0.1}
+                ]
+                
+                from src.retriever.hybrid import HybridRetriever
+                
+                retriever = HybridRetriever()
+                retriever.retrieve("Singapore strike impact", include_graph=False)
+                paraphrase = retriever.retrieve(
+                    "Impact of the Singapore strike", include_graph=False
+                )
+                
+                assert paraphrase.query == "Impact of the Singapore strike"
+                assert paraphrase.vector_chunks == ["Singapore port strike"]
+                assert mock_vector_instance.query_similar.call_count == 1
+                
+                retriever.retrieve("Flooding in Rotterdam", include_graph=False)
+                
+                assert mock_vector_instance.query_similar.call_count == 2
+
+    def test_should_extract_entities_while_looking_for_a_match(self) -> None:
+        """Should not delay entity extraction behind the query embedding."""
+        llm_started = threading.Event()
+        overlapped = []
+        
+        def embed(text):
+            overlapped.append(llm_started.wait(timeout=1))
+            return [1.0, 0.0]
+        
+        def invoke(messages):
+            llm_started.set()
+            return AIMessage(content='[]')
+        
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_vector_instance = MagicMock()
+                    mock_vector.return_value = mock_vector_instance
+                    mock_vector_instance.embed.side_effect = embed
+                    mock_vector_instance.query_similar.return_value = []
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.side_effect = invoke
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    retriever.retrieve("Singapore strike impact")
+                    
+                    assert overlapped == [True]
+
+    def test_should_share_semantic_index_with_batch_retrieve(self) -> None:
+        """Should index batched queries and answer their paraphrases."""
+        embeddings = {
+            "Singapore strike impact": [1.0, 0.0],
+            "Flooding in Rotterdam": [0.0, 1.0],
+            "Impact of the Singapore strike": [0.99, 0.05],
+            "Rotterdam flooding": [0.05, 0.99],
+        }
+        with patch("src.database.graph_db.GraphDatabaseManager"):
+            with patch("src.database.vector_db.VectorDatabaseManager") as mock_vector:
+                with patch("langchain_ollama.ChatOllama") as mock_llm_class:
+                    mock_vector_instance = MagicMock()
+                    mock_vector.return_value = mock_vector_instance
+                    mock_vector_instance.embed.side_effect = embeddings.get
+                    mock_vector_instance.query_similar_batch.return_value = [[], []]
+                    
+                    mock_llm = MagicMock()
+                    mock_llm_class.return_value = mock_llm
+                    mock_llm.invoke.return_value = AIMessage(content='{"1": [], "2": []}')
+                    
+                    from src.retriever.hybrid import HybridRetriever
+                    
+                    retriever = HybridRetriever()
+                    retriever.batch_retrieve(["Singapore strike impact", "Flooding in Rotterdam"])
+                    
+                    assert len(retriever._semantic_indexes[True]) == 2
+                    
+                    retriever.retrieve("Impact of the Singapore strike")
+                    retriever.batch_retrieve(["Rotterdam flooding"])
+                    
+                    # retrieve() extracts entities while looking for a match
+                    assert mock_llm.invoke.call_count == 2
+                    assert mock_vector_instance.query_similar_batch.call_count == 1
+                    mock_vector_instance.query_similar.assert_not_called()
+
+
+class TestGraphPath:
+    """Tests for GraphPath data class."""
+
+    def test_should_render_path_string(self) -> None:
+        """Should interleave nodes and relationships."""
+        from src.retriever.hybrid import GraphPath
+        
+        path = GraphPath(
+            nodes=["Singapore", "FlowChips", "GlobalTech"],
+            relationships=["OPERATES_AT", "SUPPLIES"],
+            path_length=2
+        )
+        
+        assert path.to_string() == "Singapore -[OPERATES_AT]-> FlowChips -[SUPPLIES]-> GlobalTech"
+
+    def test_should_render_empty_path(self) -> None:
+        """Should render an empty string for a path without nodes."""
+        from src.retriever.hybrid import GraphPath
+        
+        assert GraphPath(nodes=[], relationships=[], path_length=0).to_string() == ""
 
 
 class TestRetrievalResult:
@@ -221,3 +1355,21 @@ class TestRetrievalResult:
         
         assert "Singapore" in context
         assert "FlowChips" in context or "strike" in context
+
+    def test_should_build_combined_context_once(self) -> None:
+        """Should memoize the combined context and reset it on replace()."""
+        from dataclasses import replace
+        
+        from src.retriever.hybrid import RetrievalResult
+        
+        result = RetrievalResult(
+            query="test query",
+            vector_chunks=["Document about Singapore strike"],
+            graph_context="Singapore -> FlowChips"
+        )
+        
+        context = result.get_combined_context()
+        
+        assert result.combined_context is context
+        assert "GlobalTech" in replace(result, graph_context="GlobalTech").combined_context
+        assert result == replace(result)
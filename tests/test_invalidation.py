@@ -0,0 +1,84 @@
+"""
+Tests for store change notification.
+"""
+
+import gc
+from unittest.mock import MagicMock
+
+from src.database.invalidation import InvalidationNotifier
+
+
+class _Listener:
+    """Object with a bound-method listener."""
+    
+    def __init__(self) -> None:
+        """Start with no calls recorded."""
+        self.calls = 0
+    
+    def invalidate(self) -> None:
+        """Record a notification."""
+        self.calls += 1
+
+
+class TestInvalidationNotifier:
+    """Tests for registering and notifying listeners."""
+    
+    def test_should_call_registered_listeners(self) -> None:
+        """Should call every registered listener on notification."""
+        notifier = InvalidationNotifier()
+        function_listener = MagicMock(spec=lambda: None)
+        method_listener = _Listener()
+        notifier.add_invalidation_listener(function_listener)
+        notifier.add_invalidation_listener(method_listener.invalidate)
+        
+        notifier._notify_invalidation()
+        
+        function_listener.assert_called_once_with()
+        assert method_listener.calls == 1
+    
+    def test_should_not_keep_method_owners_alive(self) -> None:
+        """Should drop bound-method listeners once their owner is collected."""
+        notifier = InvalidationNotifier()
+        listener = _Listener()
+        notifier.add_invalidation_listener(listener.invalidate)
+        
+        del listener
+        gc.collect()
+        notifier._notify_invalidation()
+        
+        assert notifier._invalidation_listeners == []
+    
+    def test_should_prune_collected_listeners_when_adding(self) -> None:
+        """Should not accumulate dead entries while no data is written."""
+        notifier = InvalidationNotifier()
+        for _ in range(100):
+            notifier.add_invalidation_listener(_Listener().invalidate)
+        gc.collect()
+        
+        listener = _Listener()
+        notifier.add_invalidation_listener(listener.invalidate)
+        
+        assert len(notifier._invalidation_listeners) == 1
+    
+    def test_should_remove_listener(self) -> None:
+        """Should stop calling a listener after it is removed."""
+        notifier = InvalidationNotifier()
+        listener = _Listener()
+        notifier.add_invalidation_listener(listener.invalidate)
+        
+        notifier.remove_invalidation_listener(listener.invalidate)
+        notifier._notify_invalidation()
+        
+        assert listener.calls == 0
+    
+    def test_should_isolate_failing_listeners(self) -> None:
+        """Should keep notifying other listeners when one raises."""
+        notifier = InvalidationNotifier()
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        listener = _Listener()
+        notifier.add_invalidation_listener(failing)
+        notifier.add_invalidation_listener(listener.invalidate)
+        
+        notifier._notify_invalidation()
+        
+        assert listener.calls == 1
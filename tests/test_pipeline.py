@@ -86,6 +86,42 @@ class TestIngestionPipeline:
                 # Verify merge_node was called (not create_node)
                 mock_graph_instance.merge_node.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_should_keep_extracted_labels(self) -> None:
+        """Should merge nodes under the entity types the extractor reported."""
+        with patch("src.ingestion.pipeline.EntityExtractor") as mock_extractor_class:
+            with patch("src.ingestion.pipeline.VectorDatabaseManager"):
+                mock_extractor = MagicMock()
+                mock_extractor_class.return_value = mock_extractor
+                mock_extractor.extract = AsyncMock(return_value=ExtractionResult(
+                    triples=[
+                        Triple(
+                            subject="TechFlow",
+                            subject_type="Company",
+                            predicate="EMPLOYS",
+                            object="Jane Doe",
+                            object_type="Person"
+                        )
+                    ],
+                    source_text="test"
+                ))
+                
+                mock_graph_instance = MagicMock()
+                
+                from src.ingestion.pipeline import IngestionPipeline
+                
+                pipeline = IngestionPipeline(graph_manager=mock_graph_instance)
+                await pipeline.ingest_text("TechFlow employs Jane Doe")
+                
+                labels = [
+                    call.kwargs["label"]
+                    for call in mock_graph_instance.merge_node.call_args_list
+                ]
+                assert labels == ["Company", "Person"]
+                rel_kwargs = mock_graph_instance.merge_relationship.call_args.kwargs
+                assert rel_kwargs["from_label"] == "Company"
+                assert rel_kwargs["to_label"] == "Person"
+
     @pytest.mark.asyncio
     async def test_should_add_to_vector_store(self) -> None:
         """Should add documents to ChromaDB."""
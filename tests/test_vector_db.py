@@ -106,6 +106,89 @@ class TestVectorDatabaseManagerDocuments:
             
             assert len(results) == 2
 
+    def test_should_query_with_precomputed_embedding(self) -> None:
+        """Should pass a precomputed embedding instead of the query text."""
+        with patch("src.database.vector_db.chromadb") as mock_chroma:
+            mock_client = MagicMock()
+            mock_collection = MagicMock()
+            mock_chroma.PersistentClient.return_value = mock_client
+            mock_client.get_or_create_collection.return_value = mock_collection
+            mock_collection.query.return_value = {
+                "ids": [["doc1"]],
+                "documents": [["Document 1"]],
+                "distances": [[0.1]],
+                "metadatas": [[{"source": "test"}]]
+            }
+            
+            from src.database.vector_db import VectorDatabaseManager
+            
+            manager = VectorDatabaseManager()
+            
+            results = manager.query_similar(
+                collection_name="test",
+                query_text="test query",
+                n_results=1,
+                query_embedding=[0.1, 0.2]
+            )
+            
+            assert len(results) == 1
+            kwargs = mock_collection.query.call_args.kwargs
+            assert kwargs["query_embeddings"] == [[0.1, 0.2]]
+            assert "query_texts" not in kwargs
+
+    def test_should_query_several_texts_in_one_call(self) -> None:
+        """Should return one result list per query from a single query call."""
+        with patch("src.database.vector_db.chromadb") as mock_chroma:
+            mock_client = MagicMock()
+            mock_collection = MagicMock()
+            mock_chroma.PersistentClient.return_value = mock_client
+            mock_client.get_or_create_collection.return_value = mock_collection
+            mock_collection.query.return_value = {
+                "ids": [["doc1"], ["doc2", "doc3"]],
+                "documents": [["Document 1"], ["Document 2", "Document 3"]],
+                "distances": [[0.1], [0.2, 0.3]],
+                "metadatas": [[{}], [{}, {}]]
+            }
+            
+            from src.database.vector_db import VectorDatabaseManager
+            
+            manager = VectorDatabaseManager()
+            
+            results = manager.query_similar_batch(
+                collection_name="test",
+                query_texts=["first", "second"],
+                n_results=2
+            )
+            
+            assert mock_collection.query.call_count == 1
+            assert [len(docs) for docs in results] == [1, 2]
+            assert results[1][1]["document"] == "Document 3"
+
+    def test_should_fill_missing_result_fields_with_none(self) -> None:
+        """Should keep rows when Chroma omits a result field."""
+        with patch("src.database.vector_db.chromadb") as mock_chroma:
+            mock_client = MagicMock()
+            mock_collection = MagicMock()
+            mock_chroma.PersistentClient.return_value = mock_client
+            mock_client.get_or_create_collection.return_value = mock_collection
+            mock_collection.query.return_value = {
+                "ids": [["doc1", "doc2"]],
+                "documents": [["Document 1", "Document 2"]],
+                "distances": [[0.1, 0.2]],
+                "metadatas": None
+            }
+            
+            from src.database.vector_db import VectorDatabaseManager
+            
+            manager = VectorDatabaseManager()
+            
+            results = manager.query_similar(collection_name="test", query_text="q")
+            
+            assert results == [
+                {"id": "doc1", "document": "Document 1", "distance": 0.1, "metadata": None},
+                {"id": "doc2", "document": "Document 2", "distance": 0.2, "metadata": None},
+            ]
+
 
 class TestVectorDatabaseManagerHealth:
     """Tests for health checking."""
@@ -155,3 +238,16 @@ class TestVectorDatabaseManagerEmbeddings:
                 
                 # Embedding should be created with correct model
                 mock_ollama.assert_called()
+
+    def test_should_raise_when_query_embedding_fails(self) -> None:
+        """Should raise instead of returning a zero vector for single queries."""
+        from src.database.vector_db import OllamaEmbeddings
+        
+        embeddings = OllamaEmbeddings()
+        embeddings._client = MagicMock()
+        embeddings._client.embeddings.side_effect = ConnectionError("down")
+        
+        with pytest.raises(ConnectionError):
+            embeddings.embed_text("test")
+        
+        assert embeddings(["test"]) == [[0.0] * 768]